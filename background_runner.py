@@ -7,84 +7,185 @@ Runs Paper Surfer in background with minimal resource usage
 import os
 import sys
 import time
+import atexit
+import queue
 import logging
 import subprocess
+import select
 import psutil
+from logging.handlers import RotatingFileHandler, QueueHandler, QueueListener
 from datetime import datetime
 import signal
 import threading
 
+# Import config file
+try:
+    import config
+except ImportError:
+    print("Warning: config.py not found. Using default settings.")
+    config = None
+
+# Platform flags (evaluated once at import)
+IS_WINDOWS = os.name == 'nt'
+CREATION_FLAGS = subprocess.CREATE_NO_WINDOW if IS_WINDOWS else 0
+
+# Interval between periodic resource usage log lines (seconds)
+RESOURCE_LOG_INTERVAL = 300
+
+# Time to wait for an existing runner to exit before killing it (seconds)
+STOP_TIMEOUT = 10
+
+# CPU sampling window for one-off readings (a non-blocking call right after priming reads ~0%)
+CPU_SAMPLE_INTERVAL = 0.5
+
 class BackgroundRunner:
     def __init__(self):
         self.running = False
         self.process = None
+        self.pidfd = None
         self.log_file = "./logs/background_runner.log"
         self.pid_file = "./logs/background_runner.pid"
+        self.cached_pid = None  # PID read from pid_file (0 if none), refreshed on mutation
+        self.mem_total = None
+        self.cpu_count = None
         self.setup_logging()
         
     def setup_logging(self):
         """Setup logging for background runner"""
-        os.makedirs(os.path.dirname(self.log_file), exist_ok=True)
-        
-        logging.basicConfig(
-            level=logging.INFO,
-            format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-            handlers=[
-                logging.FileHandler(self.log_file, encoding='utf-8'),
-                logging.StreamHandler()
-            ]
+        log_dir = os.path.dirname(self.log_file)
+        if log_dir and not os.path.isdir(log_dir):
+            os.makedirs(log_dir, exist_ok=True)
+        
+        log_level = getattr(config, 'LOG_LEVEL', 'INFO')
+        log_max_bytes = getattr(config, 'LOG_MAX_SIZE', 10) * 1024 * 1024
+        log_backup_count = getattr(config, 'LOG_BACKUP_COUNT', 5)
+        formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+        
+        file_handler = RotatingFileHandler(
+            self.log_file,
+            maxBytes=log_max_bytes,
+            backupCount=log_backup_count,
+            encoding='utf-8'
         )
+        stream_handler = logging.StreamHandler()
+        file_handler.setFormatter(formatter)
+        stream_handler.setFormatter(formatter)
+        
+        # Callers only enqueue records; formatting and file I/O run on the listener thread
+        log_queue = queue.Queue(-1)
+        self.log_listener = QueueListener(log_queue, file_handler, stream_handler)
+        self.log_listener.start()
+        atexit.register(self.stop_logging)
+        
+        root_logger = logging.getLogger()
+        root_logger.setLevel(getattr(logging, log_level.upper()))
+        root_logger.addHandler(QueueHandler(log_queue))
         self.logger = logging.getLogger('BackgroundRunner')
         
+    def stop_logging(self):
+        """Flush queued log records and stop the listener thread"""
+        if self.log_listener is not None:
+            self.log_listener.stop()
+            self.log_listener = None
+            
     def save_pid(self):
-        """Save process ID to file"""
+        """Atomically create PID file; return False if another runner owns it"""
         os.makedirs(os.path.dirname(self.pid_file), exist_ok=True)
-        with open(self.pid_file, 'w') as f:
-            f.write(str(os.getpid()))
+        
+        # O_EXCL makes creation atomic, so concurrent starts cannot both win
+        flags = os.O_CREAT | os.O_EXCL | os.O_WRONLY
+        try:
+            fd = os.open(self.pid_file, flags, 0o644)
+        except FileExistsError:
+            self.cached_pid = None  # File was created since we last read it
+            if self.is_running():
+                return False
+            
+            # Stale PID file left by a runner that exited without cleanup
+            self.remove_pid()
+            try:
+                fd = os.open(self.pid_file, flags, 0o644)
+            except FileExistsError:
+                return False  # Another instance won the race
+        
+        try:
+            os.write(fd, str(os.getpid()).encode())
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+        self.cached_pid = os.getpid()
+        return True
             
     def remove_pid(self):
         """Remove PID file"""
-        if os.path.exists(self.pid_file):
+        try:
             os.remove(self.pid_file)
+        except FileNotFoundError:
+            pass
+        self.cached_pid = 0
+            
+    def read_pid(self):
+        """Read PID from file once per invocation (0 if missing or invalid)"""
+        if self.cached_pid is None:
+            try:
+                with open(self.pid_file, 'r') as f:
+                    self.cached_pid = int(f.read().strip())
+            except (OSError, ValueError):
+                self.cached_pid = 0
+        return self.cached_pid
             
     def is_running(self):
         """Check if background runner is already running"""
-        if not os.path.exists(self.pid_file):
+        pid = self.read_pid()
+        if not pid:
             return False
             
-        try:
-            with open(self.pid_file, 'r') as f:
-                pid = int(f.read().strip())
-            return psutil.pid_exists(pid)
-        except:
-            return False
+        return psutil.pid_exists(pid)
             
     def stop_existing(self):
         """Stop existing background runner"""
-        if not os.path.exists(self.pid_file):
+        pid = self.read_pid()
+        if not pid:
             return
             
         try:
-            with open(self.pid_file, 'r') as f:
-                pid = int(f.read().strip())
-            
             if psutil.pid_exists(pid):
-                os.kill(pid, signal.SIGTERM)
+                process = psutil.Process(pid)
+                process.terminate()
+                
+                # Returns as soon as the runner exits (psutil waits on a pidfd where available)
+                try:
+                    process.wait(timeout=STOP_TIMEOUT)
+                except psutil.TimeoutExpired:
+                    self.logger.warning(f"Runner (PID: {pid}) did not exit within {STOP_TIMEOUT}s, killing it")
+                    process.kill()
+                    process.wait(timeout=STOP_TIMEOUT)
+                    self.remove_pid()  # A killed runner cannot remove its own PID file
+                
                 self.logger.info(f"Stopped existing background runner (PID: {pid})")
-                time.sleep(2)
+                self.cached_pid = None  # The stopped runner removes its PID file
         except Exception as e:
             self.logger.error(f"Error stopping existing runner: {e}")
             
-    def get_system_resources(self):
-        """Get current system resource usage"""
-        cpu_percent = psutil.cpu_percent(interval=1)
-        memory = psutil.virtual_memory()
+    def init_resource_sampling(self):
+        """Cache values that cannot change without a restart"""
+        self.mem_total = psutil.virtual_memory().total
+        self.cpu_count = psutil.cpu_count(logical=True)
+        
+    def get_system_resources(self, cpu_interval=CPU_SAMPLE_INTERVAL):
+        """Get current system resource usage (cpu_interval=None reads the delta since the last call)"""
+        if self.mem_total is None:
+            self.init_resource_sampling()
+        
+        cpu_percent = psutil.cpu_percent(interval=cpu_interval)
+        memory_available = psutil.virtual_memory().available
         disk = psutil.disk_usage('/')
         
         return {
             'cpu_percent': cpu_percent,
-            'memory_percent': memory.percent,
-            'memory_available_gb': memory.available / (1024**3),
+            'cpu_count': self.cpu_count,
+            'memory_percent': 100.0 * (self.mem_total - memory_available) / self.mem_total,
+            'memory_available_gb': memory_available / (1024**3),
             'disk_percent': disk.percent,
             'disk_free_gb': disk.free / (1024**3)
         }
@@ -94,31 +195,31 @@ class BackgroundRunner:
         try:
             self.logger.info("Starting Paper Surfer scheduler...")
             
-            # Monitor resources before starting
+            # Monitor resources before starting (this sample is also the baseline for the periodic non-blocking reads)
             resources_before = self.get_system_resources()
             self.logger.info(f"System resources before: CPU {resources_before['cpu_percent']:.1f}%, "
                            f"Memory {resources_before['memory_percent']:.1f}%, "
                            f"Disk {resources_before['disk_percent']:.1f}%")
             
             # Start Paper Surfer in scheduler mode
+            # Output is inherited rather than piped: nobody reads a pipe here,
+            # so a full pipe buffer would eventually block the child
             self.process = subprocess.Popen(
                 [sys.executable, "main.py", "--scheduler"],
-                stdout=subprocess.PIPE,
-                stderr=subprocess.STDOUT,
-                text=True,
-                creationflags=subprocess.CREATE_NO_WINDOW if os.name == 'nt' else 0
+                close_fds=True,
+                creationflags=CREATION_FLAGS
             )
             
-            # Monitor the process
-            while self.running and self.process.poll() is None:
-                time.sleep(30)  # Check every 30 seconds
-                
-                # Log resource usage periodically
-                if int(time.time()) % 300 == 0:  # Every 5 minutes
-                    resources = self.get_system_resources()
-                    self.logger.info(f"Resource usage: CPU {resources['cpu_percent']:.1f}%, "
-                                   f"Memory {resources['memory_percent']:.1f}%, "
-                                   f"Available Memory {resources['memory_available_gb']:.1f}GB")
+            # Monitor the process (event-driven where the platform supports pidfd)
+            try:
+                self.pidfd = os.pidfd_open(self.process.pid)
+            except (AttributeError, OSError):
+                self.pidfd = None
+            
+            if self.pidfd is not None:
+                self.monitor_with_pidfd()
+            else:
+                self.monitor_with_polling()
             
             if self.process.poll() is not None:
                 self.logger.warning(f"Paper Surfer process exited with code: {self.process.returncode}")
@@ -126,42 +227,111 @@ class BackgroundRunner:
         except Exception as e:
             self.logger.error(f"Error running Paper Surfer: {e}")
             
+    def monitor_with_pidfd(self):
+        """Block on the process pidfd until it exits, waking only to log resources"""
+        epoll = select.epoll()
+        try:
+            epoll.register(self.pidfd, select.EPOLLIN)
+            next_log = time.monotonic() + RESOURCE_LOG_INTERVAL
+            
+            while self.running and self.process.poll() is None:
+                if epoll.poll(max(0.0, next_log - time.monotonic())):
+                    break  # pidfd became readable: process exited
+                
+                if time.monotonic() >= next_log:
+                    self.log_resource_usage()
+                    next_log += RESOURCE_LOG_INTERVAL
+        finally:
+            epoll.close()
+            self.close_pidfd()
+            
+    def monitor_with_polling(self):
+        """Fallback monitor loop for platforms without pidfd support"""
+        next_log = time.monotonic() + RESOURCE_LOG_INTERVAL
+        
+        while self.running and self.process.poll() is None:
+            time.sleep(30)  # Check every 30 seconds
+            
+            # Log resource usage once per interval
+            if time.monotonic() >= next_log:
+                self.log_resource_usage()
+                next_log += RESOURCE_LOG_INTERVAL
+                
+    def log_resource_usage(self):
+        """Log current system resource usage"""
+        # Non-blocking: a full logging interval has passed since the previous sample
+        resources = self.get_system_resources(cpu_interval=None)
+        self.logger.info(f"Resource usage: CPU {resources['cpu_percent']:.1f}%, "
+                       f"Memory {resources['memory_percent']:.1f}%, "
+                       f"Available Memory {resources['memory_available_gb']:.1f}GB")
+        
+    def close_pidfd(self):
+        """Close the process pidfd if open"""
+        if self.pidfd is not None:
+            os.close(self.pidfd)
+            self.pidfd = None
+            
     def start(self):
         """Start background runner"""
         if self.is_running():
             print("Background runner is already running!")
             return
             
+        if not self.save_pid():
+            print("Background runner is already running!")
+            return
+            
         self.running = True
-        self.save_pid()
         
         # Set up signal handlers
         signal.signal(signal.SIGINT, self.signal_handler)
         signal.signal(signal.SIGTERM, self.signal_handler)
         
         self.logger.info("Background runner started")
+        self.init_resource_sampling()
         
         # Reduce process priority to use less CPU
         try:
-            if os.name == 'nt':  # Windows
-                import win32process
-                win32process.SetPriorityClass(-1, win32process.BELOW_NORMAL_PRIORITY_CLASS)
+            if IS_WINDOWS:
+                psutil.Process().nice(psutil.BELOW_NORMAL_PRIORITY_CLASS)
             else:  # Unix-like
                 os.nice(10)
-        except:
-            pass
+        except (OSError, psutil.Error) as e:
+            self.logger.warning(f"Could not lower process priority: {e}")
+            
+        # Confine CPU and disk usage further (inherited by the Paper Surfer process)
+        self.limit_resource_usage()
             
         # Run Paper Surfer
         self.run_paper_surfer()
         
+    def limit_resource_usage(self):
+        """Pin to a single CPU core and drop to idle I/O priority"""
+        if hasattr(os, 'sched_setaffinity'):
+            try:
+                # Use the last allowed core so core 0 stays free for interactive work
+                os.sched_setaffinity(0, {max(os.sched_getaffinity(0))})
+            except OSError as e:
+                self.logger.warning(f"Could not set CPU affinity: {e}")
+        
+        try:
+            if IS_WINDOWS:
+                psutil.Process().ionice(psutil.IOPRIO_VERYLOW)
+            elif hasattr(psutil, 'IOPRIO_CLASS_IDLE'):  # Linux
+                psutil.Process().ionice(psutil.IOPRIO_CLASS_IDLE)
+        except (OSError, psutil.Error) as e:
+            self.logger.warning(f"Could not lower I/O priority: {e}")
+            
     def stop(self):
         """Stop background runner"""
         self.running = False
         if self.process:
             self.process.terminate()
             self.process.wait()
+        self.close_pidfd()
         self.remove_pid()
         self.logger.info("Background runner stopped")
+        self.stop_logging()
         
     def signal_handler(self, signum, frame):
         """Handle termination signals"""
@@ -173,16 +343,15 @@ class BackgroundRunner:
         """Show background runner status"""
         if self.is_running():
             print("✅ Background runner is running")
-            if os.path.exists(self.pid_file):
-                with open(self.pid_file, 'r') as f:
-                    pid = f.read().strip()
+            pid = self.read_pid()
+            if pid:
                 print(f"   PID: {pid}")
                 
                 # Show resource usage
                 try:
                     resources = self.get_system_resources()
                     print(f"   System Resources:")
-                    print(f"   - CPU: {resources['cpu_percent']:.1f}%")
+                    print(f"   - CPU: {resources['cpu_percent']:.1f}% ({resources['cpu_count']} cores)")
                     print(f"   - Memory: {resources['memory_percent']:.1f}% "
                           f"(Available: {resources['memory_available_gb']:.1f}GB)")
                     print(f"   - Disk: {resources['disk_percent']:.1f}% "
@@ -211,7 +380,6 @@ def main():
     elif command == "restart":
         print("🔄 Restarting background runner...")
         runner.stop_existing()
-        time.sleep(2)
         runner.start()
     elif command == "status":
         runner.status()
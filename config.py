@@ -17,7 +17,7 @@ PUBMED_API_KEY = ""  # Example: "YOUR_API_KEY_HERE"
 
 # Request limit settings
 MAX_REQUESTS_PER_SECOND = 10  # 3 without API key, 10 with API key
-REQUEST_DELAY = 1.0  # Minimum delay between requests (seconds)
+REQUEST_DELAY = 1.0  # Base delay for retry backoff (seconds); request rate follows NCBI limits
 
 # Email address (required: contact information must be provided when using PubMed API)
 CONTACT_EMAIL = ""  # Change to your actual email address
@@ -63,6 +63,14 @@ SEARCH_KEYWORDS = [
 # Maximum results per search
 MAX_RESULTS_PER_SEARCH = 50
 
+# Combine SEARCH_KEYWORDS into a single OR query (one request instead of one per keyword)
+# The combined query returns up to MAX_RESULTS_PER_SEARCH x number of keywords papers
+COMBINE_SEARCH_KEYWORDS = True
+
+# Keep ESearch results on the NCBI history server and page EFetch through WebEnv/query_key
+# instead of sending PMID lists (history responses are not stored in the query cache)
+USE_HISTORY_SERVER = True
+
 # Keyword matching settings
 KEYWORD_MATCH_THRESHOLD = 0.0  # Keyword matching threshold (0.0 ~ 1.0) - lowered to 0.0
 
@@ -92,8 +100,6 @@ PRIORITY_KEYWORDS = [
     "structural",
     "structural variation",
     "chromosomal instability",
-    "evolution",
-    "clonal",
     "trajectory",
     "signature",
     "driver mutation",
@@ -111,6 +117,22 @@ PRIORITY_KEYWORDS = [
 PRIORITY_KEYWORD_WEIGHT = 2.0  # Weight for priority keywords
 REQUIRED_KEYWORD_WEIGHT = 1.0  # Base weight for required keywords
 
+# Drop repeated keywords (ignoring case and surrounding spaces), keeping the first spelling and order
+def dedupe_keywords(keywords):
+    unique = {}
+    for keyword in keywords:
+        unique.setdefault(keyword.strip().lower(), keyword.strip())
+    return list(unique.values())
+
+SEARCH_KEYWORDS = dedupe_keywords(SEARCH_KEYWORDS)
+REQUIRED_KEYWORDS = dedupe_keywords(REQUIRED_KEYWORDS)
+PRIORITY_KEYWORDS = dedupe_keywords(PRIORITY_KEYWORDS)
+
+# Lowercase keyword sets (precomputed once at import for case-insensitive matching)
+SEARCH_KEYWORDS_LC = frozenset(k.lower() for k in SEARCH_KEYWORDS)
+REQUIRED_KEYWORDS_LC = frozenset(k.lower() for k in REQUIRED_KEYWORDS)
+PRIORITY_KEYWORDS_LC = frozenset(k.lower() for k in PRIORITY_KEYWORDS)
+
 # Score-based classification settings
 SCORE_THRESHOLDS = {
     "high": 0.8,    # 0.8 or higher: high relevance (increased from 0.7)
@@ -177,6 +199,14 @@ FILTER_SETTINGS = {
     ]
 }
 
+def get_filter_settings():
+    """Return FILTER_SETTINGS with the date window recomputed for the current day
+    
+    Long-running processes (scheduler, background runner) call this before each
+    search, so the window does not stay frozen at the value computed on import.
+    """
+    return {**FILTER_SETTINGS, "publication_date_from": get_date_from()}
+
 # =============================================================================
 # Storage Settings
 # =============================================================================
@@ -290,12 +320,14 @@ ENABLE_CACHING = True
 CACHE_DIR = "./cache"
 CACHE_DURATION = 3600  # seconds (1 hour)
 
-print("PubMed API-based Paper Surfer configuration loaded.")
-print(f"- Search keywords: {len(SEARCH_KEYWORDS)} keywords")
-print(f"- Output directory: {MARKDOWN_OUTPUT_DIR}")
-print(f"- Scheduling: {'Enabled' if SCHEDULE_ENABLED else 'Disabled'}")
-print(f"- API key: {'Set' if PUBMED_API_KEY else 'Not set'}")
-print(f"- Contact: {CONTACT_EMAIL}") 
-print(f"- Date filter: {'Enabled' if ENABLE_DATE_FILTER else 'Disabled'}")
-if ENABLE_DATE_FILTER:
-    print(f"- Search range: Last {SEARCH_DAYS_BACK} days (from {calculated_date_from} to today)")
+def print_summary():
+    """Print a short summary of the loaded configuration"""
+    print("PubMed API-based Paper Surfer configuration loaded.")
+    print(f"- Search keywords: {len(SEARCH_KEYWORDS)} keywords")
+    print(f"- Output directory: {MARKDOWN_OUTPUT_DIR}")
+    print(f"- Scheduling: {'Enabled' if SCHEDULE_ENABLED else 'Disabled'}")
+    print(f"- API key: {'Set' if PUBMED_API_KEY else 'Not set'}")
+    print(f"- Contact: {CONTACT_EMAIL}") 
+    print(f"- Date filter: {'Enabled' if ENABLE_DATE_FILTER else 'Disabled'}")
+    if ENABLE_DATE_FILTER:
+        print(f"- Search range: Last {SEARCH_DAYS_BACK} days (from {get_date_from()} to today)")
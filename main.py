@@ -4,13 +4,45 @@ Paper Surfer - PubMed API-based automatic paper collection tool
 Search for papers using PubMed API and save them in markdown format based on keywords
 """
 
+import io
 import os
 import sys
+import signal
 import logging
-import argparse
+from logging.handlers import MemoryHandler
+import functools
+import time
+from collections import Counter
+from itertools import islice
 from datetime import datetime
 from typing import List, Dict, Optional
 
+# Size of the stdout buffer when output is redirected (cron, background runner)
+STDOUT_BUFFER_SIZE = 1 << 16
+
+def setup_stdout():
+    """Use a larger block buffer for stdout when it is not a terminal"""
+    if sys.stdout is None or sys.stdout.isatty():
+        return
+    
+    try:
+        fileno = sys.stdout.fileno()
+    except (AttributeError, io.UnsupportedOperation):
+        return
+    
+    sys.stdout.flush()
+    raw = io.FileIO(fileno, 'w', closefd=False)
+    sys.stdout = io.TextIOWrapper(
+        io.BufferedWriter(raw, buffer_size=STDOUT_BUFFER_SIZE),
+        encoding=sys.stdout.encoding,
+        errors=sys.stdout.errors,
+        line_buffering=False,
+        write_through=False
+    )
+
+# Number of log records buffered before they are written to the log file
+LOG_BUFFER_CAPACITY = 512
+
 # Logging setup
 def setup_logging():
     """Setup logging configuration"""
@@ -26,8 +58,20 @@ def setup_logging():
         log_format = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
         log_date_format = '%Y-%m-%d %H:%M:%S'
     
-    # Create log directory
-    os.makedirs(os.path.dirname(log_file), exist_ok=True)
+    # Create log directory (a stat is cheaper than a failing mkdir on every start)
+    log_dir = os.path.dirname(log_file)
+    if log_dir and not os.path.isdir(log_dir):
+        os.makedirs(log_dir, exist_ok=True)
+    
+    # Buffer file records and write them in batches; errors flush immediately
+    file_handler = logging.FileHandler(log_file, encoding='utf-8')
+    file_handler.setFormatter(logging.Formatter(log_format, log_date_format))
+    buffered_handler = MemoryHandler(
+        capacity=LOG_BUFFER_CAPACITY,
+        flushLevel=logging.ERROR,
+        target=file_handler,
+        flushOnClose=True
+    )
     
     # Configure logging
     logging.basicConfig(
@@ -35,31 +79,57 @@ def setup_logging():
         format=log_format,
         datefmt=log_date_format,
         handlers=[
-            logging.FileHandler(log_file, encoding='utf-8'),
+            buffered_handler,
             logging.StreamHandler(sys.stdout)
         ]
     )
 
-# Import settings and modules
+# Import settings (scraper modules are imported by the modes that need them)
 try:
     import config
+    setup_stdout()
     setup_logging()
     
-    from modules.pubmed_scraper import PubMedScraper
-    from modules.markdown_saver import MarkdownSaver
-    from modules.scheduler import PaperScrapperScheduler
-    
     logger = logging.getLogger(__name__)
-    logger.info("Paper Surfer started - PubMed API version")
     
 except ImportError as e:
     print(f"Module import error: {e}")
     print("Please install required packages: pip install -r requirements.txt")
     sys.exit(1)
 
-def display_banner():
-    """Display program banner"""
-    banner = """
+# Configuration values used by the CLI modes (resolved once at import)
+MAX_RESULTS = getattr(config, 'MAX_RESULTS_PER_SEARCH', 50)
+API_KEY = getattr(config, 'PUBMED_API_KEY', None)
+CONTACT_EMAIL = getattr(config, 'CONTACT_EMAIL', 'your.email@example.com')
+OUTPUT_DIR = getattr(config, 'MARKDOWN_OUTPUT_DIR', './output/papers')
+KEYWORDS_STR = ', '.join(config.SEARCH_KEYWORDS)
+
+# Category emoji based on relevance
+CATEGORY_EMOJI = {
+    "high": "🔥",
+    "medium": "📊",
+    "low": "📄"
+}
+
+@functools.lru_cache(maxsize=1)
+def get_scraper():
+    """Return the shared PubMed scraper instance"""
+    from modules.pubmed_scraper import PubMedScraper
+    return PubMedScraper()
+
+@functools.lru_cache(maxsize=1)
+def get_saver():
+    """Return the shared markdown saver instance"""
+    from modules.markdown_saver import MarkdownSaver
+    return MarkdownSaver()
+
+@functools.lru_cache(maxsize=1)
+def get_scheduler():
+    """Return the shared scheduler instance"""
+    from modules.scheduler import PaperScrapperScheduler
+    return PaperScrapperScheduler(scraper=get_scraper(), markdown_saver=get_saver())
+
+BANNER = """
     ====================================================
     🔬 Paper Surfer - PubMed API-based Paper Collection Tool
     ====================================================
@@ -73,9 +143,34 @@ def display_banner():
     📧 Contact: {contact_email}
     ====================================================
     """.format(
-        contact_email=getattr(config, 'CONTACT_EMAIL', 'your.email@example.com')
-    )
-    print(banner)
+    contact_email=CONTACT_EMAIL
+)
+
+def display_banner():
+    """Display program banner"""
+    print(BANNER)
+
+def save_and_report(papers: List, categories: List[str], saver):
+    """Save papers as markdown and print category and file statistics"""
+    print("\n💾 Saving papers...")
+    
+    # Save paper objects directly as one batch (no per-paper dict copies)
+    saved_count = saver.save_papers(papers)
+    
+    print(f"✅ Total {saved_count} papers saved.")
+    
+    # Category statistics
+    category_counts = Counter(categories)
+    
+    print(f"\n📊 Category classification:")
+    print(f"🔥 High relevance: {category_counts['high']} papers")
+    print(f"📊 Medium relevance: {category_counts['medium']} papers") 
+    print(f"📄 Low relevance: {category_counts['low']} papers")
+    
+    # Saved file information
+    files_info = saver.get_saved_files_info()
+    print(f"\n📁 Save location: {files_info['output_directory']}")
+    print(f"📄 Saved files: {files_info['total_files']}")
 
 def run_interactive_mode():
     """Run interactive mode"""
@@ -86,7 +181,7 @@ def run_interactive_mode():
     print("\nSearch Settings:")
     
     # Keyword input
-    print(f"Default keywords: {', '.join(config.SEARCH_KEYWORDS)}")
+    print(f"Default keywords: {KEYWORDS_STR}")
     custom_keywords = input("Enter custom keywords (comma-separated, press Enter for defaults): ").strip()
     
     if custom_keywords:
@@ -95,7 +190,7 @@ def run_interactive_mode():
         keywords = config.SEARCH_KEYWORDS
     
     # Maximum results input
-    default_max_results = getattr(config, 'MAX_RESULTS_PER_SEARCH', 50)
+    default_max_results = MAX_RESULTS
     max_results_input = input(f"Maximum results (default: {default_max_results}): ").strip()
     
     try:
@@ -111,11 +206,11 @@ def run_interactive_mode():
     
     try:
         # Initialize scraper and saver
-        scraper = PubMedScraper()
-        saver = MarkdownSaver()
+        scraper = get_scraper()
+        saver = get_saver()
         
         # Search papers
-        papers = scraper.search_papers(keywords, max_results)
+        papers, _, categories = scraper.search_papers_batch(keywords, max_results)
         
         if not papers:
             print("❌ No search results found.")
@@ -127,70 +222,40 @@ def run_interactive_mode():
         print("\n📄 Top 5 papers preview:")
         print("-" * 80)
         
-        for i, paper in enumerate(papers[:5], 1):
-            # Category emoji based on relevance
-            category_emoji = {
-                "high": "🔥",
-                "medium": "📊", 
-                "low": "📄"
-            }
-            emoji = category_emoji.get(paper.relevance_category, "📄")
+        # Build the whole preview first and write it in one call
+        lines = []
+        append = lines.append
+        for i, paper in enumerate(islice(papers, 5), 1):
+            emoji = CATEGORY_EMOJI.get(paper.relevance_category, "📄")
+            authors = paper.authors
+            more_authors = '...' if len(authors) > 3 else ''
             
-            print(f"{i}. {emoji} {paper.title[:60]}...")
-            print(f"   Authors: {', '.join(paper.authors[:3])}{'...' if len(paper.authors) > 3 else ''}")
-            print(f"   Journal: {paper.journal}")
-            print(f"   Score: {paper.keyword_score:.2f} | Category: {paper.relevance_category}")
-            print(f"   PMID: {paper.pmid}")
+            append(f"{i}. {emoji} {paper.title[:60]}...")
+            append(f"   Authors: {', '.join(islice(authors, 3))}{more_authors}")
+            append(f"   Journal: {paper.journal}")
+            append(f"   Score: {paper.keyword_score:.2f} | Category: {paper.relevance_category}")
+            append(f"   PMID: {paper.pmid}")
             if paper.korean_summary:
-                print(f"   Summary: {paper.korean_summary[:80]}...")
-            print()
+                append(f"   Summary: {paper.korean_summary[:80]}...")
+            append("")
+        
+        sys.stdout.write("\n".join(lines) + "\n")
         
         # Save confirmation
         save_confirm = input("Do you want to save these papers to markdown files? (y/n): ").strip().lower()
         
         if save_confirm == 'y':
-            print("\n💾 Saving papers...")
-            
-            saved_count = 0
-            for paper in papers:
-                try:
-                    # Convert paper info to dictionary (using new method)
-                    paper_data = scraper.paper_to_dict(paper)
-                    
-                    # Save markdown file
-                    success = saver.save_paper(paper_data)
-                    if success:
-                        saved_count += 1
-                        
-                except Exception as e:
-                    logger.error(f"Failed to save paper (PMID: {paper.pmid}): {e}")
-                    continue
-            
-            print(f"✅ Total {saved_count} papers saved.")
-            
-            # Category statistics
-            category_counts = {"high": 0, "medium": 0, "low": 0}
-            for paper in papers:
-                if paper.relevance_category in category_counts:
-                    category_counts[paper.relevance_category] += 1
-            
-            print(f"\n📊 Category classification:")
-            print(f"🔥 High relevance: {category_counts['high']} papers")
-            print(f"📊 Medium relevance: {category_counts['medium']} papers") 
-            print(f"📄 Low relevance: {category_counts['low']} papers")
-            
-            # Saved file information
-            files_info = saver.get_saved_files_info()
-            print(f"\n📁 Save location: {files_info['output_directory']}")
-            print(f"📄 Saved files: {files_info['total_files']}")
+            save_and_report(papers, categories, saver)
             
         else:
             print("❌ Save cancelled.")
             
     except KeyboardInterrupt:
         print("\n⚠️  Interrupted by user")
+    except ImportError:
+        raise  # main() prints the install hint
     except Exception as e:
-        logger.error(f"Interactive mode execution error: {e}")
+        logger.exception("Interactive mode execution error: %s", e)
         print(f"❌ Error occurred: {e}")
 
 def run_once_mode():
@@ -200,19 +265,19 @@ def run_once_mode():
     
     try:
         # Display configuration values
-        print(f"Search keywords: {', '.join(config.SEARCH_KEYWORDS)}")
-        print(f"Maximum results: {getattr(config, 'MAX_RESULTS_PER_SEARCH', 50)}")
-        print(f"API key configured: {'Yes' if getattr(config, 'PUBMED_API_KEY', None) else 'No'}")
+        print(f"Search keywords: {KEYWORDS_STR}")
+        print(f"Maximum results: {MAX_RESULTS}")
+        print(f"API key configured: {'Yes' if API_KEY else 'No'}")
         
         # Initialize scraper and saver
-        scraper = PubMedScraper()
-        saver = MarkdownSaver()
+        scraper = get_scraper()
+        saver = get_saver()
         
         # Search papers
         print("\n🔍 Searching papers...")
-        papers = scraper.search_papers(
+        papers, _, categories = scraper.search_papers_batch(
             config.SEARCH_KEYWORDS, 
-            getattr(config, 'MAX_RESULTS_PER_SEARCH', 50)
+            MAX_RESULTS
         )
         
         if not papers:
@@ -222,45 +287,14 @@ def run_once_mode():
         print(f"✅ Found {len(papers)} papers.")
         
         # Save papers
-        print("\n💾 Saving papers...")
-        saved_count = 0
-        
-        for paper in papers:
-            try:
-                # Convert paper info to dictionary (using new method)
-                paper_data = scraper.paper_to_dict(paper)
-                
-                # Save markdown file
-                success = saver.save_paper(paper_data)
-                if success:
-                    saved_count += 1
-                    
-            except Exception as e:
-                logger.error(f"Failed to save paper (PMID: {paper.pmid}): {e}")
-                continue
-        
-        print(f"✅ Total {saved_count} papers saved.")
-        
-        # Category statistics
-        category_counts = {"high": 0, "medium": 0, "low": 0}
-        for paper in papers:
-            if paper.relevance_category in category_counts:
-                category_counts[paper.relevance_category] += 1
-        
-        print(f"\n📊 Category classification:")
-        print(f"🔥 High relevance: {category_counts['high']} papers")
-        print(f"📊 Medium relevance: {category_counts['medium']} papers") 
-        print(f"📄 Low relevance: {category_counts['low']} papers")
-        
-        # Saved file information
-        files_info = saver.get_saved_files_info()
-        print(f"\n📁 Save location: {files_info['output_directory']}")
-        print(f"📄 Saved files: {files_info['total_files']}")
+        save_and_report(papers, categories, saver)
         
     except KeyboardInterrupt:
         print("\n⚠️  Interrupted by user")
+    except ImportError:
+        raise  # main() prints the install hint
     except Exception as e:
-        logger.error(f"One-time execution error: {e}")
+        logger.exception("One-time execution error: %s", e)
         print(f"❌ Error occurred: {e}")
 
 def run_scheduler_mode():
@@ -270,14 +304,14 @@ def run_scheduler_mode():
     
     try:
         # Initialize scheduler
-        scheduler = PaperScrapperScheduler()
+        scheduler = get_scheduler()
         
         # Display schedule information
         schedule_info = scheduler.get_schedule_info()
         print(f"Schedule enabled: {schedule_info['enabled']}")
         print(f"Execution time: {schedule_info['time']}")
-        print(f"Execution days: {', '.join(schedule_info['days'])}")
-        print(f"Search keywords: {', '.join(schedule_info['keywords'])}")
+        print(f"Execution days: {schedule_info['days_str']}")
+        print(f"Search keywords: {schedule_info['keywords_str']}")
         print(f"Maximum results: {schedule_info['max_results']}")
         
         if schedule_info['next_run']:
@@ -293,21 +327,42 @@ def run_scheduler_mode():
         
         scheduler.start_scheduler()
         
-        # Main loop
+        # Block until Ctrl+C; the scheduler runs on its own thread
+        # (time.sleep, unlike a lock or Event wait, is interrupted by Ctrl+C on Windows)
         try:
             while True:
-                import time
-                time.sleep(1)
+                time.sleep(60)
         except KeyboardInterrupt:
             print("\n⚠️  Interrupted by user")
         finally:
             scheduler.stop_scheduler()
             print("✅ Scheduler stopped safely.")
             
+    except ImportError:
+        raise  # main() prints the install hint
     except Exception as e:
-        logger.error(f"Scheduler mode execution error: {e}")
+        logger.exception("Scheduler mode execution error: %s", e)
         print(f"❌ Error occurred: {e}")
 
+def count_files(directory: str) -> tuple:
+    """Count all files and markdown files under a directory (recursive)"""
+    total_files = 0
+    md_files = 0
+    pending = [directory]
+    
+    # scandir entries carry their file type, so no extra stat per file is needed
+    while pending:
+        with os.scandir(pending.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    pending.append(entry.path)
+                elif entry.is_file():
+                    total_files += 1
+                    if entry.name.endswith('.md'):
+                        md_files += 1
+    
+    return total_files, md_files
+
 def show_status():
     """Display system status"""
     print("\n📊 System Status")
@@ -316,105 +371,105 @@ def show_status():
     try:
         # Configuration information
         print("📋 Configuration:")
-        print(f"  - PubMed API key: {'Set' if getattr(config, 'PUBMED_API_KEY', None) else 'Not set'}")
-        print(f"  - Contact email: {getattr(config, 'CONTACT_EMAIL', 'your.email@example.com')}")
+        print(f"  - PubMed API key: {'Set' if API_KEY else 'Not set'}")
+        print(f"  - Contact email: {CONTACT_EMAIL}")
         print(f"  - Search keywords: {len(config.SEARCH_KEYWORDS)} keywords")
-        print(f"  - Maximum results: {getattr(config, 'MAX_RESULTS_PER_SEARCH', 50)}")
+        print(f"  - Maximum results: {MAX_RESULTS}")
         
         # Output directory information
-        output_dir = getattr(config, 'MARKDOWN_OUTPUT_DIR', './output/papers')
+        output_dir = OUTPUT_DIR
         print(f"\n📁 Output directory: {output_dir}")
         
         if os.path.exists(output_dir):
             # Count files
-            total_files = 0
-            md_files = 0
-            for root, dirs, files in os.walk(output_dir):
-                total_files += len(files)
-                md_files += len([f for f in files if f.endswith('.md')])
+            total_files, md_files = count_files(output_dir)
             
             print(f"  - Total files: {total_files}")
             print(f"  - Markdown files: {md_files}")
         else:
             print("  - Directory not yet created.")
         
-        # Scheduler information
-        try:
-            scheduler = PaperScrapperScheduler()
-            schedule_info = scheduler.get_schedule_info()
-            
-            print(f"\n⏰ Scheduler information:")
-            print(f"  - Enabled: {schedule_info['enabled']}")
-            print(f"  - Execution time: {schedule_info['time']}")
-            print(f"  - Execution days: {', '.join(schedule_info['days'])}")
-            print(f"  - Running: {schedule_info['is_running']}")
-            
-            if schedule_info['next_run']:
-                print(f"  - Next execution: {schedule_info['next_run']}")
-                
-        except Exception as e:
-            print(f"  - Failed to load scheduler info: {e}")
+        # Scheduler information (read from config; building a scheduler would load the scraper stack)
+        print(f"\n⏰ Scheduler information:")
+        print(f"  - Enabled: {getattr(config, 'SCHEDULE_ENABLED', True)}")
+        print(f"  - Execution time: {getattr(config, 'SCHEDULE_TIME', '09:00')}")
+        print(f"  - Execution days: {', '.join(getattr(config, 'SCHEDULE_DAYS', ['sunday']))}")
             
     except Exception as e:
         print(f"❌ Failed to load status information: {e}")
 
-def main():
-    """Main function"""
-    # Parse command line arguments
-    parser = argparse.ArgumentParser(
-        description="PubMed API-based automatic paper collection tool",
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
+# Command line flags (checked in this priority order)
+MODE_FLAGS = (
+    (('--once', '-o'), run_once_mode),
+    (('--scheduler', '-s'), run_scheduler_mode),
+    (('--status', '-st'), show_status),
+    (('--interactive', '-i'), run_interactive_mode),
+)
+
+USAGE = """usage: main.py [-h] [--interactive] [--once] [--scheduler] [--status]
+
+PubMed API-based automatic paper collection tool
+
+options:
+  -h, --help         show this help message and exit
+  --interactive, -i  Run in interactive mode
+  --once, -o         Run once (based on config file)
+  --scheduler, -s    Run in scheduler mode
+  --status, -st      Check system status
+
 Usage examples:
   python main.py                     # Interactive mode
   python main.py --interactive       # Interactive mode (explicit)
   python main.py --once              # One-time execution
   python main.py --scheduler         # Scheduler mode
   python main.py --status            # Status check
-        """
-    )
-    
-    parser.add_argument(
-        '--interactive', '-i', 
-        action='store_true',
-        help='Run in interactive mode'
-    )
+"""
+
+def parse_mode(argv: List[str]):
+    """Select the mode function from command line flags (default: interactive mode)"""
+    if '-h' in argv or '--help' in argv:
+        print(USAGE)
+        sys.exit(0)
     
-    parser.add_argument(
-        '--once', '-o',
-        action='store_true', 
-        help='Run once (based on config file)'
-    )
+    known_flags = {flag for flags, _ in MODE_FLAGS for flag in flags}
+    unknown = [arg for arg in argv if arg not in known_flags]
+    if unknown:
+        sys.stderr.write(f"{USAGE.splitlines()[0]}\nmain.py: error: unrecognized arguments: {' '.join(unknown)}\n")
+        sys.exit(2)
     
-    parser.add_argument(
-        '--scheduler', '-s',
-        action='store_true',
-        help='Run in scheduler mode'
-    )
+    for flags, run_mode in MODE_FLAGS:
+        if any(flag in argv for flag in flags):
+            return run_mode
     
-    parser.add_argument(
-        '--status', '-st',
-        action='store_true',
-        help='Check system status'
-    )
+    return run_interactive_mode
+
+def handle_sigterm(signum, frame):
+    """Exit normally on SIGTERM so buffered log records are flushed at shutdown"""
+    sys.exit(0)
+
+def main():
+    """Main function"""
+    # Parse command line arguments
+    run_mode = parse_mode(sys.argv[1:])
     
-    args = parser.parse_args()
+    # background_runner stops this process with terminate()
+    signal.signal(signal.SIGTERM, handle_sigterm)
+    logger.info("Paper Surfer started - PubMed API version")
     
-    # Display banner
-    display_banner()
+    # Display banner (scheduler mode prints its own header and runs unattended)
+    if run_mode is not run_scheduler_mode:
+        display_banner()
+    config.print_summary()
     
     # Select and run mode
-    if args.once:
-        run_once_mode()
-    elif args.scheduler:
-        run_scheduler_mode()
-    elif args.status:
-        show_status()
-    elif args.interactive:
-        run_interactive_mode()
-    else:
-        # Default: interactive mode
-        run_interactive_mode()
+    try:
+        run_mode()
+    except ImportError as e:
+        print(f"Module import error: {e}")
+        print("Please install required packages: pip install -r requirements.txt")
+        sys.exit(1)
+    finally:
+        sys.stdout.flush()
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
@@ -6,10 +6,13 @@ Save collected paper information in markdown format
 import os
 import logging
 from datetime import datetime
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Any, Union
 from pathlib import Path
 import json
 import re
+import string
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
 # Import config file
 try:
@@ -50,6 +53,58 @@ DEFAULT_MARKDOWN_TEMPLATE = """# {title}
 *This document was automatically generated by Paper Surfer.*
 """
 
+# Maximum number of threads used to write papers in parallel
+MAX_SAVE_WORKERS = 32
+
+# Write buffer size for markdown files (large enough that a paper is written in one syscall)
+WRITE_BUFFER_SIZE = 1 << 18
+
+# str.format conversion flags (!r, !s, !a)
+TEMPLATE_CONVERSIONS = {'r': repr, 's': str, 'a': ascii}
+
+class PaperFields:
+    """Read-only mapping view of a paper object for templates (list fields are comma-joined)"""
+    
+    __slots__ = ('paper',)
+    
+    def __init__(self, paper: Any):
+        self.paper = paper
+    
+    def __getitem__(self, key: str):
+        try:
+            value = getattr(self.paper, key)
+        except AttributeError:
+            raise KeyError(key) from None
+        if isinstance(value, list):
+            return ', '.join(value)
+        return value
+    
+    def get(self, key: str, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+def compile_template(template: str):
+    """Parse a str.format template once and return a renderer for its named fields"""
+    parts = [
+        (literal, field, spec or '', TEMPLATE_CONVERSIONS.get(conversion))
+        for literal, field, spec, conversion in string.Formatter().parse(template)
+    ]
+    
+    def render(fields) -> str:
+        chunks = []
+        for literal, field, spec, convert in parts:
+            chunks.append(literal)
+            if field is not None:
+                value = fields[field]
+                if convert:
+                    value = convert(value)
+                chunks.append(format(value, spec))
+        return ''.join(chunks)
+    
+    return render
+
 class MarkdownSaver:
     """Class to save paper information in Markdown format"""
     
@@ -63,9 +118,14 @@ class MarkdownSaver:
         self.file_prefix = getattr(config, 'MARKDOWN_FILE_PREFIX', 'paper')
         self.file_suffix = getattr(config, 'MARKDOWN_FILE_SUFFIX', '.md')
         self.template = getattr(config, 'MARKDOWN_TEMPLATE', DEFAULT_MARKDOWN_TEMPLATE)
+        self.render_template = compile_template(self.template)  # Parsed once, reused per paper
         
         self.logger = logging.getLogger(__name__)
         
+        # Paths claimed by in-flight saves (parallel saves must not pick the same filename)
+        self.path_lock = threading.Lock()
+        self.reserved_paths = set()
+        
         # Create date-based subdirectories (depending on settings)
         if self.enable_date_folders:
             today = datetime.now().strftime('%Y-%m-%d')
@@ -155,8 +215,28 @@ class MarkdownSaver:
         
         return result.strip()
     
-    def save_paper(self, paper_data: Dict) -> bool:
-        """Save PubMed paper data as Markdown file"""
+    def write_file(self, filepath: Path, content: str):
+        """Write file via a hidden temporary sibling and rename it into place
+        
+        Sync clients (iCloud/Obsidian) watching the output folder only ever see
+        complete files, instead of uploading each partially written one.
+        """
+        temp_path = filepath.with_name(f".{filepath.name}.tmp")
+        try:
+            with open(temp_path, 'w', encoding='utf-8', buffering=WRITE_BUFFER_SIZE) as f:
+                f.write(content)
+            os.replace(temp_path, filepath)
+        except OSError:
+            if temp_path.exists():
+                temp_path.unlink()
+            raise
+    
+    def save_paper(self, paper_data: Union[Dict, Any]) -> bool:
+        """Save PubMed paper data (dictionary or PubMedPaper object) as Markdown file"""
+        if not isinstance(paper_data, dict):
+            # Read fields straight from the paper object instead of copying them into a dict
+            paper_data = PaperFields(paper_data)
+        
         try:
             # Generate filename
             title = paper_data.get('title', 'untitled_paper')
@@ -195,28 +275,54 @@ class MarkdownSaver:
             filepath = target_dir / filename
             
             # Handle duplicate filenames
-            counter = 1
-            original_filepath = filepath
-            while filepath.exists():
-                stem = original_filepath.stem
-                suffix = original_filepath.suffix
-                filepath = target_dir / f"{stem}_{counter}{suffix}"
-                counter += 1
-            
-            # Generate Markdown content
-            markdown_content = self.template.format(**paper_data)
+            with self.path_lock:
+                counter = 1
+                original_filepath = filepath
+                while filepath.exists() or filepath in self.reserved_paths:
+                    stem = original_filepath.stem
+                    suffix = original_filepath.suffix
+                    filepath = target_dir / f"{stem}_{counter}{suffix}"
+                    counter += 1
+                self.reserved_paths.add(filepath)
             
-            # Save file
-            with open(filepath, 'w', encoding='utf-8') as f:
-                f.write(markdown_content)
+            try:
+                # Generate Markdown content
+                markdown_content = self.render_template(paper_data)
+                
+                # Save file
+                self.write_file(filepath, markdown_content)
+            finally:
+                # Once written, the file itself claims the name; on failure the name is free again
+                with self.path_lock:
+                    self.reserved_paths.discard(filepath)
             
-            self.logger.info(f"Paper Markdown saved successfully: {filepath}")
+            self.logger.info("Paper Markdown saved successfully: %s", filepath)
             return True
             
         except Exception as e:
-            self.logger.error(f"Markdown save failed: {e}")
+            self.logger.error("Markdown save failed (PMID: %s): %s", paper_data.get('pmid'), e)
             return False
     
+    def save_papers(self, papers_data: List[Union[Dict, Any]]) -> int:
+        """
+        Save multiple PubMed papers as Markdown files
+        
+        Args:
+            papers_data: List of paper dictionaries or PubMedPaper objects (see save_paper)
+            
+        Returns:
+            Number of papers saved successfully
+        """
+        if not papers_data:
+            return 0
+        
+        # Writes are I/O-bound, so threads overlap them (the GIL is released during file I/O)
+        with ThreadPoolExecutor(max_workers=min(MAX_SAVE_WORKERS, len(papers_data))) as executor:
+            saved_count = sum(executor.map(self.save_paper, papers_data))
+        
+        self.logger.info(f"Total {saved_count}/{len(papers_data)} paper Markdowns saved")
+        return saved_count
+    
     def create_paper_markdown(self, paper_info, 
                             keyword_analysis: Optional[Dict] = None, 
                             sections: Optional[Dict] = None) -> str:
@@ -331,14 +437,13 @@ class MarkdownSaver:
         
         # Save file
         try:
-            with open(filepath, 'w', encoding='utf-8') as f:
-                f.write(markdown_content)
+            self.write_file(filepath, markdown_content)
             
-            self.logger.info(f"Paper Markdown saved successfully: {filepath}")
+            self.logger.info("Paper Markdown saved successfully: %s", filepath)
             return str(filepath)
             
         except Exception as e:
-            self.logger.error(f"Markdown save failed: {e}")
+            self.logger.error("Markdown save failed: %s", e)
             return None
     
     def save_batch_papers(self, papers_data: List[Dict]) -> List[str]:
@@ -3,16 +3,29 @@ PubMed API scraper module
 Search for papers using PubMed API and collect metadata
 """
 
+import io
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import time
 import re
 import logging
-from datetime import datetime
-from dataclasses import dataclass
-from typing import List, Dict, Optional, Any
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, date
+from dataclasses import dataclass, field
+from operator import attrgetter
+from typing import List, Dict, Optional, Any, Tuple
 from urllib.parse import urlencode, quote
 from bs4 import BeautifulSoup
-import xml.etree.ElementTree as ET
+
+# lxml parses large EFetch responses considerably faster; fall back to the standard library
+try:
+    from lxml import etree as ET
+except ImportError:
+    import xml.etree.ElementTree as ET
+
+from modules.query_cache import QueryCache
 
 # Import config file
 try:
@@ -21,7 +34,59 @@ except ImportError:
     print("Warning: config.py not found. Using default settings.")
     config = None
 
-@dataclass
+# Maximum number of keywords searched concurrently in per-keyword mode
+MAX_SEARCH_WORKERS = 8
+
+# Maximum number of EFetch chunks downloaded concurrently for one search
+MAX_FETCH_WORKERS = 4
+
+# PMIDs per EFetch request, for ID lists and history pages alike (cache keys depend on the split)
+EFETCH_CHUNK_SIZE = 200
+
+def compile_path(path: str):
+    """Compile an element path once (lxml XPath when available, ElementPath findall otherwise)"""
+    if hasattr(ET, 'XPath'):
+        return ET.XPath(path)
+    return lambda elem: elem.findall(path)
+
+# Element paths used to parse EFetch articles (compiled once, evaluated per article)
+PMID_PATH = compile_path('.//PMID')
+TITLE_PATH = compile_path('.//ArticleTitle')
+ABSTRACT_PATH = compile_path('.//Abstract/AbstractText')
+AUTHOR_PATH = compile_path('.//AuthorList/Author')
+JOURNAL_PATH = compile_path('.//Journal/Title')
+PUB_DATE_PATH = compile_path('.//PubDate')
+ARTICLE_ID_PATH = compile_path('.//ArticleId')
+MESH_PATH = compile_path('.//MeshHeadingList/MeshHeading/DescriptorName')
+KEYWORD_PATH = compile_path('.//KeywordList/Keyword')
+PUB_TYPE_PATH = compile_path('.//PublicationType')
+LANGUAGE_PATH = compile_path('.//Language')
+GRANT_PATH = compile_path('.//GrantList/Grant/GrantID')
+
+# PubDate month names to numbers
+MONTH_NUMBERS = {
+    'Jan': '01', 'Feb': '02', 'Mar': '03', 'Apr': '04',
+    'May': '05', 'Jun': '06', 'Jul': '07', 'Aug': '08',
+    'Sep': '09', 'Oct': '10', 'Nov': '11', 'Dec': '12'
+}
+
+# Terms checked by _generate_korean_summary, matched as substrings in a single scan.
+# "genomic" also covers "genomics"; a "breast cancer" match implies "cancer" (checked first).
+SUMMARY_TERM_PATTERN = re.compile(
+    "breast cancer|cancer|sequencing|genomic|mutation|treatment|therapy|therapeutic|"
+    "diagnosis|analysis|study|patient|clinical|genetic"
+)
+
+# Patterns used by _clean_text
+HTML_TAG_PATTERN = re.compile(r'<[^>]+>')
+WHITESPACE_PATTERN = re.compile(r'\s+')
+
+def first_text(elements: list) -> str:
+    """Text of the first matched element (empty string if none)"""
+    return (elements[0].text or "") if elements else ""
+
+# Slotted for faster attribute access in the scoring/saving loops (not frozen: scores are set after parsing)
+@dataclass(slots=True)
 class PubMedPaper:
     """Data class to store PubMed paper information"""
     pmid: str
@@ -43,6 +108,24 @@ class PubMedPaper:
     keyword_score: float
     korean_summary: str = ""
     relevance_category: str = ""
+    
+    # Lowercased text for keyword matching, filled once by index_text() after parsing
+    title_lc: str = field(default="", init=False, repr=False, compare=False)
+    abstract_lc: str = field(default="", init=False, repr=False, compare=False)
+    text_lc: str = field(default="", init=False, repr=False, compare=False)  # title, abstract, keywords, MeSH terms
+    authors_lc: str = field(default="", init=False, repr=False, compare=False)
+    
+    def index_text(self):
+        """Cache lowercased title/abstract/keyword text used by filtering and scoring"""
+        self.title_lc = self.title.lower()
+        self.abstract_lc = self.abstract.lower()
+        self.text_lc = " ".join([
+            self.title_lc,
+            self.abstract_lc,
+            " ".join(self.keywords).lower(),
+            " ".join(self.mesh_terms).lower()
+        ])
+        self.authors_lc = " ".join(self.authors).lower()
 
 class PubMedScraper:
     """Class to search and collect papers using PubMed API"""
@@ -65,46 +148,164 @@ class PubMedScraper:
             'Accept': 'application/xml,application/json,text/xml,text/plain'
         })
         
+        # Keep-alive connection pool sized for concurrent searches, with retry/backoff on transient errors
+        retry = Retry(
+            total=max(self.max_retries - 1, 0),
+            backoff_factor=self.request_delay,
+            status_forcelist=[429, 500, 502, 503, 504],
+            respect_retry_after_header=True,
+            raise_on_status=False
+        )
+        pool_size = MAX_SEARCH_WORKERS * MAX_FETCH_WORKERS
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+        self.session.mount(self.base_url, adapter)
+        
+        # Disk cache for E-utilities responses (ENABLE_CACHING in config)
+        self.query_cache = QueryCache()
+        
+        # Filter settings snapshot (refreshed at the start of every search)
+        self.filter_settings = self._load_filter_settings()
+        self.date_range = self._parse_date_range(self.filter_settings)
+        
+        # Scoring settings (lowercased once here instead of per paper)
+        self.required_keywords = frozenset(k.lower() for k in getattr(config, 'REQUIRED_KEYWORDS', []))
+        self.priority_keywords = frozenset(k.lower() for k in getattr(config, 'PRIORITY_KEYWORDS', []))
+        self.required_weight = getattr(config, 'REQUIRED_KEYWORD_WEIGHT', 1.0)
+        self.priority_weight = getattr(config, 'PRIORITY_KEYWORD_WEIGHT', 2.0)
+        # High-impact journal names matched as substrings of the journal title in one regex scan
+        high_impact_journals = getattr(config, 'HIGH_IMPACT_JOURNALS', [])
+        self.high_impact_journal_pattern = re.compile(
+            "|".join(re.escape(journal.lower()) for journal in high_impact_journals)
+        ) if high_impact_journals else None
+        self.score_thresholds = getattr(config, 'SCORE_THRESHOLDS', {
+            "high": 0.7, "medium": 0.4, "low": 0.0
+        })
+        
+        # History server usage (set per search)
+        self.use_history = False
+        
+        # Request rate limit shared by all search threads (NCBI allows 10 req/s with an API key, 3 without)
+        self.min_request_interval = 0.1 if self.api_key else 1 / 3
+        self.rate_lock = threading.Lock()
+        self.next_request_time = 0.0
+        
         self.logger.info(f"PubMed scraper initialization complete")
         self.logger.info(f"API key configured: {'Yes' if self.api_key else 'No'}")
     
-    def search_papers(self, keywords: List[str], max_results: int = 50) -> List[PubMedPaper]:
+    def search_papers(self, keywords: List[str], max_results: int = 50, use_history: Optional[bool] = None) -> List[PubMedPaper]:
         """
         Search papers with keyword list
         
         Args:
             keywords: List of search keywords
             max_results: Maximum results per search
+            use_history: Fetch details through the Entrez history server instead of PMID lists
+                (defaults to USE_HISTORY_SERVER in config)
             
         Returns:
             List of found papers
         """
-        all_papers = []
+        self.filter_settings = self._load_filter_settings()
+        self.date_range = self._parse_date_range(self.filter_settings)
+        if use_history is None:
+            use_history = getattr(config, 'USE_HISTORY_SERVER', False)
+        self.use_history = use_history
+        
+        if getattr(config, 'COMBINE_SEARCH_KEYWORDS', False) and len(keywords) > 1:
+            return self._search_combined_keywords(keywords, max_results * len(keywords))
+        
+        # Keywords are searched concurrently; _make_request keeps the combined rate under the NCBI limit
+        with ThreadPoolExecutor(max_workers=min(MAX_SEARCH_WORKERS, len(keywords)) or 1) as executor:
+            results = executor.map(lambda keyword: self._search_keyword_logged(keyword, max_results), keywords)
+            
+            # Remove duplicates (based on PMID, earlier keywords win as in the sequential search)
+            seen_pmids = set()
+            unique_papers = []
+            for papers in results:
+                for paper in papers:
+                    if paper.pmid not in seen_pmids:
+                        seen_pmids.add(paper.pmid)
+                        unique_papers.append(paper)
+        
+        # Score after deduplication so a paper found by several keywords is scored once
+        result_papers = self._filter_and_score_papers(unique_papers)
+        self.logger.info(f"Total {len(result_papers)} unique papers found")
         
-        for keyword in keywords:
-            self.logger.info(f"Starting search with keyword '{keyword}'")
-            try:
-                papers = self._search_single_keyword(keyword, max_results)
-                all_papers.extend(papers)
-                self.logger.info(f"Keyword '{keyword}': {len(papers)} papers found")
-                
-                # Respect API rate limits
-                time.sleep(self.request_delay)
-                
-            except Exception as e:
-                self.logger.error(f"Error searching keyword '{keyword}': {str(e)}")
-                continue
+        return result_papers
+    
+    def search_papers_batch(self, keywords: List[str], max_results: int = 50, use_history: Optional[bool] = None) -> Tuple[List[PubMedPaper], List[float], List[str]]:
+        """
+        Search papers and return scores and categories as parallel lists
         
-        # Remove duplicates (based on PMID)
-        unique_papers = {}
-        for paper in all_papers:
-            if paper.pmid not in unique_papers:
-                unique_papers[paper.pmid] = paper
+        Args:
+            keywords: List of search keywords
+            max_results: Maximum results per search
+            use_history: Fetch details through the Entrez history server instead of PMID lists
+                (defaults to USE_HISTORY_SERVER in config)
+            
+        Returns:
+            Tuple of (papers, keyword scores, relevance categories)
+        """
+        papers = self.search_papers(keywords, max_results, use_history)
+        scores = [paper.keyword_score for paper in papers]
+        categories = [paper.relevance_category for paper in papers]
+        return papers, scores, categories
+    
+    def _load_filter_settings(self) -> Optional[Dict[str, Any]]:
+        """
+        Load filter settings with an up-to-date date window
         
-        result_papers = list(unique_papers.values())
-        self.logger.info(f"Total {len(result_papers)} unique papers found")
+        Returns:
+            Filter settings dictionary (None if not configured)
+        """
+        if hasattr(config, 'get_filter_settings'):
+            return config.get_filter_settings()
+        return getattr(config, 'FILTER_SETTINGS', None)
+    
+    def _parse_date_range(self, filter_settings: Optional[Dict[str, Any]]) -> Optional[Tuple[date, Optional[date]]]:
+        """
+        Parse the publication date filter once per search
         
-        return result_papers
+        Args:
+            filter_settings: Filter settings dictionary
+            
+        Returns:
+            (date_from, date_to or None) tuple, or None if no date filter applies
+        """
+        if not filter_settings or not filter_settings.get('publication_date_from'):
+            return None
+        
+        try:
+            date_from = datetime.strptime(filter_settings['publication_date_from'], "%Y/%m/%d").date()
+            date_to = filter_settings.get('publication_date_to')
+            if date_to:
+                date_to = datetime.strptime(date_to, "%Y/%m/%d").date()
+            return date_from, date_to or None
+            
+        except ValueError as e:
+            self.logger.warning(f"Invalid publication date filter, date filtering disabled: {str(e)}")
+            return None
+    
+    def _search_keyword_logged(self, keyword: str, max_results: int) -> List[PubMedPaper]:
+        """
+        Search single keyword, logging progress and errors (runs in a worker thread)
+        
+        Args:
+            keyword: Search keyword
+            max_results: Maximum results
+            
+        Returns:
+            List of found papers (empty on error)
+        """
+        self.logger.info(f"Starting search with keyword '{keyword}'")
+        try:
+            papers = self._search_single_keyword(keyword, max_results)
+            self.logger.info(f"Keyword '{keyword}': {len(papers)} papers found")
+            return papers
+            
+        except Exception as e:
+            self.logger.error(f"Error searching keyword '{keyword}': {str(e)}")
+            return []
     
     def _search_single_keyword(self, keyword: str, max_results: int) -> List[PubMedPaper]:
         """
@@ -115,34 +316,87 @@ class PubMedScraper:
             max_results: Maximum results
             
         Returns:
-            List of found papers
+            List of found papers (not yet filtered or scored; search_papers does that after deduplication)
         """
         # Step 1: Get PMID list with ESearch
-        pmids = self._search_pmids(keyword, max_results)
+        pmids, history = self._search_pmids(keyword, max_results)
         if not pmids:
             return []
         
         # Step 2: Get detailed information with EFetch
-        papers = self._fetch_paper_details(pmids, keyword)
+        return self._fetch_paper_details(pmids, keyword, history)
+    
+    def _search_combined_keywords(self, keywords: List[str], max_results: int) -> List[PubMedPaper]:
+        """
+        Search papers for all keywords with a single OR query
+        
+        Args:
+            keywords: List of search keywords
+            max_results: Maximum results for the combined query
+            
+        Returns:
+            List of found papers
+        """
+        self.logger.info(f"Starting combined search with {len(keywords)} keywords")
         
-        # Step 3: Calculate keyword matching scores and filter
-        filtered_papers = self._filter_and_score_papers(papers, keyword)
+        # Required keywords are ANDed server-side so retmax is not spent on papers filtered out later
+        # Each term is grouped so multi-word keywords and the OR group bind before the ANDed filters
+        keyword_terms = " OR ".join(f'({keyword}[All Fields])' for keyword in keywords)
+        clauses = [f'({keyword_terms})']
+        clauses.extend(f'({keyword}[All Fields])' for keyword in getattr(config, 'REQUIRED_KEYWORDS', []))
+        keyword_clause = " AND ".join(clauses)
         
-        return filtered_papers
+        # ESearch returns at most 10,000 PMIDs per query
+        pmids, history = self._search_pmids(", ".join(keywords), min(max_results, 10000), keyword_clause)
+        if not pmids:
+            self.logger.info("Total 0 unique papers found")
+            return []
+        
+        papers = self._fetch_paper_details(pmids, ", ".join(keywords), history)
+        
+        # Attribute each paper to the first keyword it matches, as the per-keyword search would
+        for paper in papers:
+            paper.search_keyword = self._match_search_keyword(paper, keywords)
+        
+        result_papers = self._filter_and_score_papers(papers)
+        self.logger.info(f"Total {len(result_papers)} unique papers found")
+        
+        return result_papers
+    
+    def _match_search_keyword(self, paper: PubMedPaper, keywords: List[str]) -> str:
+        """
+        Find the first search keyword whose words all appear in the paper
+        
+        Args:
+            paper: Paper information
+            keywords: List of search keywords
+            
+        Returns:
+            Matching keyword (all keywords comma-joined if none match)
+        """
+        fields = (paper.text_lc, paper.authors_lc)
+        
+        for keyword in keywords:
+            if all(any(word in field for field in fields) for word in keyword.lower().split()):
+                return keyword
+        
+        # PubMed matched the paper through fields not in the parsed text; do not credit a single keyword
+        return ", ".join(keywords)
     
-    def _search_pmids(self, keyword: str, max_results: int) -> List[str]:
+    def _search_pmids(self, keyword: str, max_results: int, keyword_clause: Optional[str] = None) -> Tuple[List[str], Optional[Tuple[str, str]]]:
         """
         Search PMID list using ESearch API
         
         Args:
             keyword: Search keyword
             max_results: Maximum results
+            keyword_clause: Prebuilt keyword query (defaults to keyword[All Fields])
             
         Returns:
-            List of PMIDs
+            Tuple of (list of PMIDs, history server (WebEnv, query_key) or None)
         """
         # Build search query
-        query = self._build_search_query(keyword)
+        query = self._build_search_query(keyword, keyword_clause)
         
         # Call ESearch API
         esearch_url = f"{self.base_url}esearch.fcgi"
@@ -159,77 +413,91 @@ class PubMedScraper:
         if self.api_key:
             params['api_key'] = self.api_key
         
+        # Keep the result set on the history server so EFetch can page through it
+        history = None
+        if self.use_history:
+            params['usehistory'] = 'y'
+        
         # Apply date filter
-        if config and hasattr(config, 'FILTER_SETTINGS'):
-            filter_settings = config.FILTER_SETTINGS
-            if filter_settings:
-                date_from = filter_settings.get('publication_date_from')
-                date_to = filter_settings.get('publication_date_to')
-                
-                if date_from:
-                    params['datetype'] = 'pdat'
-                    params['mindate'] = date_from
-                    if date_to:
-                        params['maxdate'] = date_to
+        filter_settings = self.filter_settings
+        if filter_settings:
+            date_from = filter_settings.get('publication_date_from')
+            date_to = filter_settings.get('publication_date_to')
+            
+            if date_from:
+                params['datetype'] = 'pdat'
+                params['mindate'] = date_from
+                if date_to:
+                    params['maxdate'] = date_to
         
         try:
-            response = self._make_request(esearch_url, params)
-            pmids = self._parse_esearch_response(response)
+            if self.use_history:
+                # Cache under the plain query; a cached WebEnv would have expired on the server
+                cache_params = {name: value for name, value in params.items() if name != 'usehistory'}
+                response_content = self.query_cache.get(esearch_url, cache_params)
+                if response_content is None:
+                    response_content = self._make_request(esearch_url, params).content
+                    self.query_cache.set(esearch_url, cache_params, response_content)
+                    history = self._parse_esearch_history(response_content)
+                # On a cache hit history stays None and the PMIDs are fetched by ID (also cached)
+            else:
+                response_content = self._fetch_content(esearch_url, params)
+            pmids = self._parse_esearch_response(response_content)
             self.logger.debug(f"ESearch result: {len(pmids)} PMIDs")
-            return pmids
+            return pmids, history
             
         except Exception as e:
             self.logger.error(f"ESearch request failed: {str(e)}")
-            return []
+            return [], None
     
-    def _build_search_query(self, keyword: str) -> str:
+    def _build_search_query(self, keyword: str, keyword_clause: Optional[str] = None) -> str:
         """
         Build PubMed search query (including date filtering)
         
         Args:
             keyword: Base keyword
+            keyword_clause: Prebuilt keyword query used instead of keyword
             
         Returns:
             PubMed search query
         """
         # Search broadly (all fields including title, abstract, keywords, MeSH terms)
         # Changed to [All Fields] for broader search
-        base_query = f'{keyword}[All Fields]'
+        base_query = keyword_clause or f'{keyword}[All Fields]'
         
         # Apply additional filters
         filters = []
         
-        if config and hasattr(config, 'FILTER_SETTINGS'):
-            filter_settings = config.FILTER_SETTINGS
-            if filter_settings:
-                # Date filter (most important filter)
-                date_from = filter_settings.get('publication_date_from')
-                date_to = filter_settings.get('publication_date_to')
-                
-                if date_from:
-                    # PubMed date format: YYYY/MM/DD
-                    if date_to:
-                        # Date range specification
-                        date_filter = f'("{date_from}"[Publication Date] : "{date_to}"[Publication Date])'
-                    else:
-                        # From start date to current
-                        from datetime import datetime
-                        current_date = datetime.now().strftime("%Y/%m/%d")
-                        date_filter = f'("{date_from}"[Publication Date] : "{current_date}"[Publication Date])'
-                    
-                    filters.append(date_filter)
-                    self.logger.info(f"Date filter applied: {date_filter}")
-                
-                # Language filter
-                if filter_settings.get('languages'):
-                    lang_filter = ' OR '.join([f'"{lang}"[Language]' for lang in filter_settings['languages']])
-                    filters.append(f'({lang_filter})')
+        filter_settings = self.filter_settings
+        if filter_settings:
+            # Date filter (most important filter)
+            date_from = filter_settings.get('publication_date_from')
+            date_to = filter_settings.get('publication_date_to')
+            
+            if date_from:
+                # PubMed date format: YYYY/MM/DD
+                if date_to:
+                    # Date range specification
+                    date_filter = f'("{date_from}"[Publication Date] : "{date_to}"[Publication Date])'
+                else:
+                    # From start date to current
+                    from datetime import datetime
+                    current_date = datetime.now().strftime("%Y/%m/%d")
+                    date_filter = f'("{date_from}"[Publication Date] : "{current_date}"[Publication Date])'
                 
-                # Publication type filter (temporarily removed for testing)
-                # if filter_settings.get('publication_types'):
-                #     pub_types = filter_settings['publication_types']
-                #     type_filter = ' OR '.join([f'"{pt}"[Publication Type]' for pt in pub_types])
-                #     filters.append(f'({type_filter})')
+                filters.append(date_filter)
+                self.logger.info(f"Date filter applied: {date_filter}")
+            
+            # Language filter
+            if filter_settings.get('languages'):
+                lang_filter = ' OR '.join([f'"{lang}"[Language]' for lang in filter_settings['languages']])
+                filters.append(f'({lang_filter})')
+            
+            # Publication type filter (temporarily removed for testing)
+            # if filter_settings.get('publication_types'):
+            #     pub_types = filter_settings['publication_types']
+            #     type_filter = ' OR '.join([f'"{pt}"[Publication Type]' for pt in pub_types])
+            #     filters.append(f'({type_filter})')
         
         # Final query construction
         if filters:
@@ -240,13 +508,14 @@ class PubMedScraper:
         self.logger.debug(f"Search query: {final_query}")
         return final_query
     
-    def _fetch_paper_details(self, pmids: List[str], search_keyword: str) -> List[PubMedPaper]:
+    def _fetch_paper_details(self, pmids: List[str], search_keyword: str, history: Optional[Tuple[str, str]] = None) -> List[PubMedPaper]:
         """
         Fetch detailed paper information using EFetch API
         
         Args:
             pmids: List of PMIDs
             search_keyword: Search keyword
+            history: History server (WebEnv, query_key) from ESearch, if any
             
         Returns:
             List of detailed paper information
@@ -254,44 +523,68 @@ class PubMedScraper:
         if not pmids:
             return []
         
-        # Process PMIDs in chunks (maximum 200 at a time)
-        chunk_size = 200
-        all_papers = []
+        # Process PMIDs in chunks (the same split with or without the history server,
+        # so a repeat search served from a cached ESearch hits the cached EFetch chunks)
+        chunk_size = EFETCH_CHUNK_SIZE
+        efetch_url = f"{self.base_url}efetch.fcgi"
+        chunk_params = []
+        chunk_cache_params = []
         
         for i in range(0, len(pmids), chunk_size):
             chunk_pmids = pmids[i:i + chunk_size]
             
-            # Call EFetch API
-            efetch_url = f"{self.base_url}efetch.fcgi"
+            # EFetch API parameters
             params = {
                 'db': 'pubmed',
-                'id': ','.join(chunk_pmids),
                 'retmode': 'xml',
                 'rettype': 'abstract',
                 'tool': self.tool_name,
                 'email': self.email
             }
             
+            # Responses are cached by PMID list, so history pages and ID fetches share entries
+            cache_params = dict(params, id=','.join(chunk_pmids))
+            
+            if history:
+                # Page through the stored ESearch result instead of sending the PMID list
+                params['WebEnv'], params['query_key'] = history
+                params['retstart'] = i
+                params['retmax'] = len(chunk_pmids)
+            else:
+                params = cache_params
+            
             if self.api_key:
                 params['api_key'] = self.api_key
             
+            chunk_params.append(params)
+            chunk_cache_params.append(cache_params)
+        
+        def fetch_chunk(chunk_index: int) -> List[PubMedPaper]:
             try:
-                response = self._make_request(efetch_url, params)
-                chunk_papers = self._parse_efetch_response(response, search_keyword)
-                all_papers.extend(chunk_papers)
-                
-                # Respect API rate limits
-                time.sleep(self.request_delay)
+                response_content = self._fetch_content(efetch_url, chunk_params[chunk_index], chunk_cache_params[chunk_index])
+                return self._parse_efetch_response(response_content, search_keyword)
                 
             except Exception as e:
-                self.logger.error(f"EFetch request failed (PMID chunk {i//chunk_size + 1}): {str(e)}")
-                continue
+                self.logger.error(f"EFetch request failed (PMID chunk {chunk_index + 1}): {str(e)}")
+                return []
+        
+        chunk_indexes = range(len(chunk_params))
+        if len(chunk_params) == 1:
+            chunk_results = map(fetch_chunk, chunk_indexes)
+        else:
+            # Chunks are independent; fetch them concurrently (the rate limiter still spaces requests)
+            with ThreadPoolExecutor(max_workers=min(MAX_FETCH_WORKERS, len(chunk_params))) as executor:
+                chunk_results = list(executor.map(fetch_chunk, chunk_indexes))
+        
+        all_papers = []
+        for chunk_papers in chunk_results:
+            all_papers.extend(chunk_papers)
         
         return all_papers
     
     def _make_request(self, url: str, params: Dict[str, Any]) -> requests.Response:
         """
-        Execute HTTP request (with retry logic)
+        Execute HTTP request (retried by the session adapter)
         
         Args:
             url: Request URL
@@ -300,41 +593,61 @@ class PubMedScraper:
         Returns:
             Response object
         """
-        last_exception = None
+        # Retries and backoff (including Retry-After on 429) are handled by the session adapter
+        self._wait_for_rate_limit()
+        response = self.session.get(url, params=params, timeout=self.timeout)
+        response.raise_for_status()
+        return response
+    
+    def _wait_for_rate_limit(self):
+        """Block until the next request slot under the NCBI rate limit (shared across threads)"""
+        with self.rate_lock:
+            now = time.monotonic()
+            wait_time = self.next_request_time - now
+            self.next_request_time = max(now, self.next_request_time) + self.min_request_interval
+        
+        if wait_time > 0:
+            time.sleep(wait_time)
+    
+    def _fetch_content(self, url: str, params: Dict[str, Any], cache_params: Optional[Dict[str, Any]] = None) -> bytes:
+        """
+        Return raw response body, served from the query cache when possible
         
-        for attempt in range(self.max_retries):
-            try:
-                response = self.session.get(url, params=params, timeout=self.timeout)
-                response.raise_for_status()
-                return response
-                
-            except requests.exceptions.RequestException as e:
-                last_exception = e
-                if attempt == self.max_retries - 1:
-                    break
-                
-                wait_time = (2 ** attempt) * self.request_delay
-                self.logger.warning(f"Request failed (attempt {attempt + 1}/{self.max_retries}), retrying in {wait_time} seconds: {str(e)}")
-                time.sleep(wait_time)
+        Args:
+            url: Request URL
+            params: Request parameters
+            cache_params: Parameters identifying the response in the cache (defaults to params)
+            
+        Returns:
+            Response bytes (the XML parser handles decoding)
+        """
+        if cache_params is None:
+            cache_params = params
+        
+        cached_content = self.query_cache.get(url, cache_params)
+        if cached_content is not None:
+            return cached_content
         
-        # Raise exception if all retries fail
-        raise last_exception or requests.exceptions.RequestException("Unknown error")
+        response_content = self._make_request(url, params).content
+        self.query_cache.set(url, cache_params, response_content)
+        return response_content
     
-    def _parse_esearch_response(self, response: requests.Response) -> List[str]:
+    def _parse_esearch_response(self, response_content: bytes) -> List[str]:
         """
         Parse ESearch response
         
         Args:
-            response: ESearch response
+            response_content: ESearch response body
             
         Returns:
             List of PMIDs
         """
         try:
             # Log response content for debugging
-            self.logger.debug(f"ESearch response content: {response.text[:1000]}...")
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug(f"ESearch response content: {response_content[:1000].decode('utf-8', 'replace')}...")
             
-            root = ET.fromstring(response.text)
+            root = ET.fromstring(response_content)
             pmids = []
             
             for id_elem in root.findall('.//IdList/Id'):
@@ -353,35 +666,66 @@ class PubMedScraper:
             self.logger.error(f"ESearch response parsing error: {str(e)}")
             return []
     
-    def _parse_efetch_response(self, response: requests.Response, search_keyword: str) -> List[PubMedPaper]:
+    def _parse_esearch_history(self, response_content: bytes) -> Optional[Tuple[str, str]]:
+        """
+        Extract history server session from ESearch response
+        
+        Args:
+            response_content: ESearch response body
+            
+        Returns:
+            (WebEnv, query_key) tuple, or None if the response has no history session
+        """
+        try:
+            root = ET.fromstring(response_content)
+        except ET.ParseError:
+            return None
+        
+        web_env = root.findtext('WebEnv')
+        query_key = root.findtext('QueryKey')
+        if web_env and query_key:
+            return web_env, query_key
+        
+        self.logger.warning("ESearch response has no history session, falling back to PMID lists")
+        return None
+    
+    def _parse_efetch_response(self, response_content: bytes, search_keyword: str) -> List[PubMedPaper]:
         """
         Parse EFetch response
         
         Args:
-            response: EFetch response
+            response_content: EFetch response body
             search_keyword: Search keyword
             
         Returns:
             List of paper information
         """
+        papers = []
+        root = None
+        
         try:
-            root = ET.fromstring(response.text)
-            papers = []
-            
-            for article in root.findall('.//PubmedArticle'):
+            # Stream articles and drop each one once parsed, so only one article tree is held at a time
+            for event, elem in ET.iterparse(io.BytesIO(response_content), events=('start', 'end')):
+                if root is None:
+                    root = elem
+                if event != 'end' or elem.tag != 'PubmedArticle':
+                    continue
+                
                 try:
-                    paper = self._parse_single_article(article, search_keyword)
+                    paper = self._parse_single_article(elem, search_keyword)
                     if paper:
                         papers.append(paper)
                 except Exception as e:
                     self.logger.warning(f"Error parsing individual paper: {str(e)}")
-                    continue
+                
+                # Articles are children of the root PubmedArticleSet; clearing it frees the parsed ones
+                root.clear()
             
             return papers
             
         except ET.ParseError as e:
             self.logger.error(f"EFetch response parsing error: {str(e)}")
-            return []
+            return papers
     
     def _parse_single_article(self, article_elem: ET.Element, search_keyword: str) -> Optional[PubMedPaper]:
         """
@@ -395,18 +739,18 @@ class PubMedScraper:
             Paper information object
         """
         try:
-            # Extract PMID
-            pmid_elem = article_elem.find('.//PMID')
-            pmid = pmid_elem.text if pmid_elem is not None else ""
+            # Extract and validate required fields before parsing the rest
+            pmid = first_text(PMID_PATH(article_elem))
+            if not pmid:
+                return None
             
-            # Extract title
-            title_elem = article_elem.find('.//ArticleTitle')
-            title = self._clean_text(title_elem.text if title_elem is not None and title_elem.text else "")
+            title = self._clean_text(first_text(TITLE_PATH(article_elem)))
+            if not title:
+                return None
             
             # Extract abstract
-            abstract_elems = article_elem.findall('.//Abstract/AbstractText')
             abstract_parts = []
-            for abs_elem in abstract_elems:
+            for abs_elem in ABSTRACT_PATH(article_elem):
                 label = abs_elem.get('Label', '')
                 text = abs_elem.text or ""
                 if label:
@@ -415,10 +759,16 @@ class PubMedScraper:
                     abstract_parts.append(text)
             abstract = self._clean_text(" ".join(abstract_parts))
             
+            # Check abstract length
+            filter_settings = self.filter_settings
+            if filter_settings:
+                min_abstract_length = filter_settings.get('min_abstract_length', 0)
+                if len(abstract) < min_abstract_length:
+                    return None
+            
             # Extract authors
             authors = []
-            author_elems = article_elem.findall('.//AuthorList/Author')
-            for author_elem in author_elems:
+            for author_elem in AUTHOR_PATH(article_elem):
                 last_name = author_elem.find('LastName')
                 first_name = author_elem.find('ForeName')
                 if last_name is not None and first_name is not None:
@@ -428,72 +778,51 @@ class PubMedScraper:
                         authors.append(f"{first_name_text} {last_name_text}")
             
             # Extract journal information
-            journal_elem = article_elem.find('.//Journal/Title')
-            journal = journal_elem.text if journal_elem is not None and journal_elem.text else ""
+            journal = first_text(JOURNAL_PATH(article_elem))
             
             # Extract publication date
             pub_date = self._extract_publication_date(article_elem)
             
-            # Extract DOI
+            # Extract DOI and PMC ID in one pass (first match wins; reference lists come later)
             doi = ""
-            doi_elems = article_elem.findall('.//ArticleId')
-            for doi_elem in doi_elems:
-                if doi_elem.get('IdType') == 'doi':
-                    doi = doi_elem.text or ""
-                    break
-            
-            # Extract PMC ID
             pmc_id = ""
-            for pmc_elem in doi_elems:
-                if pmc_elem.get('IdType') == 'pmc':
-                    pmc_id = pmc_elem.text or ""
+            for id_elem in ARTICLE_ID_PATH(article_elem):
+                id_type = id_elem.get('IdType')
+                if id_type == 'doi' and not doi:
+                    doi = id_elem.text or ""
+                elif id_type == 'pmc' and not pmc_id:
+                    pmc_id = id_elem.text or ""
+                if doi and pmc_id:
                     break
             
             # Extract MeSH terms
             mesh_terms = []
-            mesh_elems = article_elem.findall('.//MeshHeadingList/MeshHeading/DescriptorName')
-            for mesh_elem in mesh_elems:
+            for mesh_elem in MESH_PATH(article_elem):
                 mesh_text = mesh_elem.text
                 if mesh_text:
                     mesh_terms.append(mesh_text)
             
             # Extract keywords
             keywords = []
-            keyword_elems = article_elem.findall('.//KeywordList/Keyword')
-            for keyword_elem in keyword_elems:
+            for keyword_elem in KEYWORD_PATH(article_elem):
                 keyword_text = keyword_elem.text
                 if keyword_text:
                     keywords.append(keyword_text)
             
             # Extract publication type
-            pub_type_elems = article_elem.findall('.//PublicationType')
-            pub_types = [pt.text for pt in pub_type_elems if pt.text]
+            pub_types = [pt.text for pt in PUB_TYPE_PATH(article_elem) if pt.text]
             publication_type = ", ".join(pub_types) if pub_types else ""
             
             # Extract language
-            language_elem = article_elem.find('.//Language')
-            language = language_elem.text if language_elem is not None and language_elem.text else "eng"
+            language = first_text(LANGUAGE_PATH(article_elem)) or "eng"
             
             # Extract grants
             grants = []
-            grant_elems = article_elem.findall('.//GrantList/Grant/GrantID')
-            for grant_elem in grant_elems:
+            for grant_elem in GRANT_PATH(article_elem):
                 grant_text = grant_elem.text
                 if grant_text:
                     grants.append(grant_text)
             
-            # Validate required fields
-            if not pmid or not title:
-                return None
-            
-            # Check abstract length
-            if config and hasattr(config, 'FILTER_SETTINGS'):
-                filter_settings = config.FILTER_SETTINGS
-                if filter_settings:
-                    min_abstract_length = filter_settings.get('min_abstract_length', 0)
-                    if len(abstract) < min_abstract_length:
-                        return None
-            
             # Create PubMedPaper object
             paper = PubMedPaper(
                 pmid=pmid,
@@ -516,6 +845,7 @@ class PubMedScraper:
                 korean_summary="",  # Generate later
                 relevance_category=""  # Set later
             )
+            paper.index_text()
             
             return paper
             
@@ -534,8 +864,9 @@ class PubMedScraper:
             Publication date string
         """
         # Extract date from PubDate element
-        pub_date_elem = article_elem.find('.//PubDate')
-        if pub_date_elem is not None:
+        pub_date_elems = PUB_DATE_PATH(article_elem)
+        if pub_date_elems:
+            pub_date_elem = pub_date_elems[0]
             year_elem = pub_date_elem.find('Year')
             month_elem = pub_date_elem.find('Month')
             day_elem = pub_date_elem.find('Day')
@@ -545,14 +876,8 @@ class PubMedScraper:
             day = day_elem.text if day_elem is not None else ""
             
             # Convert month name to number
-            month_map = {
-                'Jan': '01', 'Feb': '02', 'Mar': '03', 'Apr': '04',
-                'May': '05', 'Jun': '06', 'Jul': '07', 'Aug': '08',
-                'Sep': '09', 'Oct': '10', 'Nov': '11', 'Dec': '12'
-            }
-            
-            if month and month in month_map:
-                month = month_map[month]
+            if month and month in MONTH_NUMBERS:
+                month = MONTH_NUMBERS[month]
             elif month and month.isdigit():
                 month = month.zfill(2)
             
@@ -569,102 +894,102 @@ class PubMedScraper:
         
         return ""
     
-    def _filter_and_score_papers(self, papers: List[PubMedPaper], search_keyword: str) -> List[PubMedPaper]:
+    def _filter_and_score_papers(self, papers: List[PubMedPaper]) -> List[PubMedPaper]:
         """
         Filter papers and calculate keyword matching scores (including date filtering)
         
         Args:
-            papers: List of papers
-            search_keyword: Search keyword
+            papers: List of papers (scored against each paper's search_keyword)
             
         Returns:
             Filtered list of papers
         """
         filtered_papers = []
+        
+        # Read settings once rather than per paper
         threshold = getattr(config, 'KEYWORD_MATCH_THRESHOLD', 0.0)
+        date_range = self.date_range
+        required_keywords = self.required_keywords
+        summary_enabled = getattr(config, 'ENABLE_KOREAN_SUMMARY', True)
+        summary_max_length = getattr(config, 'SUMMARY_MAX_LENGTH', 150)
+        
+        # Papers from one search share a keyword, so split each keyword only once
+        # (a comma-joined fallback label is split back into its individual keywords)
+        search_words_by_keyword = {}
         
         for paper in papers:
             # Check date filter
-            if not self._check_date_filter(paper):
+            if date_range and not self._check_date_filter(paper, date_range):
                 continue  # Exclude if date condition is not met
             
             # Check required keywords
-            if not self._check_required_keywords(paper):
+            if required_keywords and not self._check_required_keywords(paper, required_keywords):
                 continue  # Exclude if required keywords are missing
             
             # Calculate keyword matching score
-            score = self._calculate_keyword_score(paper, search_keyword)
+            search_words = search_words_by_keyword.get(paper.search_keyword)
+            if search_words is None:
+                search_words = search_words_by_keyword[paper.search_keyword] = [
+                    keyword.lower().split() for keyword in paper.search_keyword.split(", ")
+                ]
+            score = self._calculate_keyword_score(paper, search_words)
+            
+            # Include only papers above threshold
+            if score < threshold:
+                continue
+            
             paper.keyword_score = score
             
             # Set relevance category
             paper.relevance_category = self._categorize_paper(score, paper)
             
             # Generate Korean summary
-            paper.korean_summary = self._generate_korean_summary(paper)
+            if summary_enabled:
+                paper.korean_summary = self._generate_korean_summary(paper, summary_max_length)
             
-            # Include only papers above threshold
-            if score >= threshold:
-                filtered_papers.append(paper)
+            filtered_papers.append(paper)
         
         # Sort by score
-        filtered_papers.sort(key=lambda x: x.keyword_score, reverse=True)
+        filtered_papers.sort(key=attrgetter('keyword_score'), reverse=True)
         
         return filtered_papers
     
-    def _check_date_filter(self, paper: PubMedPaper) -> bool:
+    def _check_date_filter(self, paper: PubMedPaper, date_range: Tuple[date, Optional[date]]) -> bool:
         """
         Check if the publication date of the paper falls within the set date range
         
         Args:
             paper: Paper information
+            date_range: (date_from, date_to) from _parse_date_range
             
         Returns:
             Whether date condition is met
         """
-        if not config or not hasattr(config, 'FILTER_SETTINGS'):
-            return True
-        
-        filter_settings = config.FILTER_SETTINGS
-        if not filter_settings:
-            return True
-        
-        date_from = filter_settings.get('publication_date_from')
-        date_to = filter_settings.get('publication_date_to')
-        
-        if not date_from:
-            return True  # No date filter set, allow all papers
-        
         # Parse paper's publication date
         paper_date = paper.pub_date
         if not paper_date:
             return True  # No publication date, allow
         
         try:
-            from datetime import datetime
-            
-            # Convert paper publication date to datetime object
+            # Dates come from _extract_publication_date in fixed formats, so slice instead of strptime
             if len(paper_date) == 10:  # YYYY-MM-DD format
-                paper_datetime = datetime.strptime(paper_date, "%Y-%m-%d")
+                paper_day = date(int(paper_date[:4]), int(paper_date[5:7]), int(paper_date[8:]))
             elif len(paper_date) == 7:  # YYYY-MM format
-                paper_datetime = datetime.strptime(paper_date, "%Y-%m")
+                paper_day = date(int(paper_date[:4]), int(paper_date[5:]), 1)
             elif len(paper_date) == 4:  # YYYY format
-                paper_datetime = datetime.strptime(paper_date, "%Y")
+                paper_day = date(int(paper_date), 1, 1)
             else:
                 return True  # Cannot determine format, allow
             
-            # Convert filter dates to datetime objects
-            date_from_datetime = datetime.strptime(date_from, "%Y/%m/%d")
-            
             # Compare dates
-            if paper_datetime < date_from_datetime:
+            date_from, date_to = date_range
+            if paper_day < date_from:
                 self.logger.debug(f"Paper {paper.pmid} date filtering: {paper_date} < {date_from}")
                 return False
             
-            if date_to:
-                date_to_datetime = datetime.strptime(date_to, "%Y/%m/%d")
-                if paper_datetime > date_to_datetime:
-                    self.logger.debug(f"Paper {paper.pmid} date filtering: {paper_date} > {date_to}")
-                    return False
+            if date_to and paper_day > date_to:
+                self.logger.debug(f"Paper {paper.pmid} date filtering: {paper_date} > {date_to}")
+                return False
             
             return True
             
@@ -672,81 +997,35 @@ class PubMedScraper:
             self.logger.warning(f"Paper {paper.pmid} date parsing error: {paper_date}, {str(e)}")
             return True  # Allow on parsing error
     
-    def _check_required_keywords(self, paper: PubMedPaper) -> bool:
+    def _check_required_keywords(self, paper: PubMedPaper, required_keywords: frozenset) -> bool:
         """
         Check if all required keywords are included
         
         Args:
             paper: Paper information
+            required_keywords: Lowercased required keywords
             
         Returns:
             Whether all required keywords are included
         """
-        required_keywords = getattr(config, 'REQUIRED_KEYWORDS', [])
-        if not required_keywords:
-            return True  # No required keywords set, allow all papers
-        
-        # Combine all text from the paper (lowercase)
-        all_text = " ".join([
-            paper.title,
-            paper.abstract,
-            " ".join(paper.keywords),
-            " ".join(paper.mesh_terms)
-        ]).lower()
-        
-        # Check if all required keywords are included
-        for required_keyword in required_keywords:
-            if required_keyword.lower() not in all_text:
-                return False
-        
-        return True
+        # Check if all required keywords are included (lowercased text cached at parse time)
+        all_text = paper.text_lc
+        return all(required_keyword in all_text for required_keyword in required_keywords)
     
-    def _generate_korean_summary(self, paper: PubMedPaper) -> str:
+    def _generate_korean_summary(self, paper: PubMedPaper, max_length: int = 150) -> str:
         """
         Generate Korean summary for the paper
         
         Args:
             paper: Paper information
+            max_length: Maximum summary length
             
         Returns:
             Korean summary string
         """
-        if not getattr(config, 'ENABLE_KOREAN_SUMMARY', True):
-            return ""
-        
-        max_length = getattr(config, 'SUMMARY_MAX_LENGTH', 150)
-        
-        # Generate simple keyword-based summary
-        title = paper.title.lower()
-        abstract = paper.abstract.lower()
-        
-        # Translate important keywords and Korean
-        keyword_translations = {
-            "breast cancer": "Breast Cancer",
-            "cancer": "Cancer",
-            "tumor": "Tumor", 
-            "mutation": "Mutation",
-            "sequencing": "Sequencing",
-            "genomics": "Genomics",
-            "genome": "Genome",
-            "gene": "Gene",
-            "therapy": "Therapy",
-            "treatment": "Treatment",
-            "diagnosis": "Diagnosis",
-            "prognosis": "Prognosis",
-            "biomarker": "Biomarker",
-            "evolution": "Evolution",
-            "clonal": "Clonal",
-            "structural variation": "Structural Variation",
-            "copy number": "Copy Number",
-            "somatic": "Somatic",
-            "germline": "Germline",
-            "whole genome": "Whole Genome",
-            "duplication": "Duplication",
-            "analysis": "Analysis",
-            "study": "Study",
-            "patient": "Patient"
-        }
+        # Find all summary terms in one regex pass per field (lowercased text cached at parse time)
+        title = set(SUMMARY_TERM_PATTERN.findall(paper.title_lc))
+        abstract = set(SUMMARY_TERM_PATTERN.findall(paper.abstract_lc))
         
         # Generate summary
         summary_parts = []
@@ -760,7 +1039,7 @@ class PubMedScraper:
         # Determine research method
         if "sequencing" in title or "sequencing" in abstract:
             summary_parts.append("Sequencing")
-        if "genomics" in title or "genomic" in title:
+        if "genomic" in title:
             summary_parts.append("Genomics")
         if "mutation" in title or "mutation" in abstract:
             summary_parts.append("Mutation")
@@ -818,18 +1097,14 @@ class PubMedScraper:
             Category (high/medium/low)
         """
         # Check for high-impact journals (Nature, Cell, Science, etc.)
-        high_impact_journals = getattr(config, 'HIGH_IMPACT_JOURNALS', [])
-        if high_impact_journals and paper.journal:
-            journal_lower = paper.journal.lower()
-            for high_journal in high_impact_journals:
-                if high_journal.lower() in journal_lower:
-                    self.logger.info(f"Paper published in high-impact journal {paper.journal} - automatically categorized as high relevance")
-                    return "high"
+        high_impact_journal_pattern = self.high_impact_journal_pattern
+        if high_impact_journal_pattern and paper.journal:
+            if high_impact_journal_pattern.search(paper.journal.lower()):
+                self.logger.info(f"Paper published in high-impact journal {paper.journal} - automatically categorized as high relevance")
+                return "high"
         
         # General score-based categorization
-        thresholds = getattr(config, 'SCORE_THRESHOLDS', {
-            "high": 0.7, "medium": 0.4, "low": 0.0
-        })
+        thresholds = self.score_thresholds
         
         if score >= thresholds["high"]:
             return "high"
@@ -838,66 +1113,55 @@ class PubMedScraper:
         else:
             return "low"
     
-    def _calculate_keyword_score(self, paper: PubMedPaper, search_keyword: str) -> float:
+    def _calculate_keyword_score(self, paper: PubMedPaper, search_words: List[List[str]]) -> float:
         """
         Calculate keyword matching score (based on required keywords + priority keywords)
         
         Args:
             paper: Paper information
-            search_keyword: Search keyword
+            search_words: Lowercased words of each search keyword (best-matching keyword counts)
             
         Returns:
             Matching score (0.0 ~ 1.0)
         """
-        # Combine all text from the paper
-        title_lower = paper.title.lower()
-        abstract_lower = paper.abstract.lower()
-        keywords_lower = " ".join(paper.keywords).lower()
-        mesh_lower = " ".join(paper.mesh_terms).lower()
-        authors_lower = " ".join(paper.authors).lower()
-        all_text = " ".join([title_lower, abstract_lower, keywords_lower, mesh_lower, authors_lower])
+        # Paper text lowercased once at parse time; fields are tested separately rather than joined
+        title_lower = paper.title_lc
+        abstract_lower = paper.abstract_lc
+        authors_lower = paper.authors_lc
+        text_lower = paper.text_lc
+        fields = (text_lower, authors_lower)
         
         # Basic score (keyword matching)
-        search_words = search_keyword.lower().split()
-        base_score = self._calculate_text_score(all_text, search_words)
+        base_score = max((self._calculate_text_score(fields, words) for words in search_words), default=0.0)
         
-        # Required keyword score
-        required_keywords = getattr(config, 'REQUIRED_KEYWORDS', [])
-        required_weight = getattr(config, 'REQUIRED_KEYWORD_WEIGHT', 1.0)
+        # Required keyword score (lowercase sets built once in __init__)
+        required_keywords = self.required_keywords
+        required_weight = self.required_weight
+        required_hits = [keyword for keyword in required_keywords if keyword in text_lower or keyword in authors_lower]
         required_score = 0.0
         if required_keywords:
-            required_matches = sum(1 for keyword in required_keywords 
-                                 if keyword.lower() in all_text)
-            required_score = (required_matches / len(required_keywords)) * required_weight
+            required_score = (len(required_hits) / len(required_keywords)) * required_weight
         
         # Priority keyword score
-        priority_keywords = getattr(config, 'PRIORITY_KEYWORDS', [])
-        priority_weight = getattr(config, 'PRIORITY_KEYWORD_WEIGHT', 2.0)
+        priority_keywords = self.priority_keywords
+        priority_weight = self.priority_weight
+        priority_hits = [keyword for keyword in priority_keywords if keyword in text_lower or keyword in authors_lower]
         priority_score = 0.0
         if priority_keywords:
-            priority_matches = sum(1 for keyword in priority_keywords 
-                                 if keyword.lower() in all_text)
-            priority_score = (priority_matches / len(priority_keywords)) * priority_weight
+            priority_score = (len(priority_hits) / len(priority_keywords)) * priority_weight
         
         # Apply field-specific weights
-        title_bonus = 0.0
-        abstract_bonus = 0.0
+        # A keyword missing from every field cannot be in any single field, so only hits are rescanned
+        matched_keywords = required_hits + priority_hits
         
         # Add bonus if important keywords are in the title
-        for keyword in required_keywords + priority_keywords:
-            if keyword.lower() in title_lower:
-                title_bonus += 0.5
+        title_bonus = 0.5 * sum(1 for keyword in matched_keywords if keyword in title_lower)
         
         # Add bonus if important keywords are in the abstract
-        for keyword in required_keywords + priority_keywords:
-            if keyword.lower() in abstract_lower:
-                abstract_bonus += 0.2
+        abstract_bonus = 0.2 * sum(1 for keyword in matched_keywords if keyword in abstract_lower)
         
         # Add bonus if keywords are in the authors
-        author_bonus = 0.0
-        for keyword in required_keywords + priority_keywords:
-            if keyword.lower() in authors_lower:
-                author_bonus += 0.3
+        author_bonus = 0.3 * sum(1 for keyword in matched_keywords if keyword in authors_lower)
         
         # Final score calculation
         total_score = base_score + required_score + priority_score + title_bonus + abstract_bonus + author_bonus
@@ -905,24 +1169,21 @@ class PubMedScraper:
         # Normalize score (0.0 ~ 1.0)
         return min(total_score / 6.0, 1.0)  # Normalize by max score (updated for author bonus)
     
-    def _calculate_text_score(self, text: str, keywords: List[str]) -> float:
+    def _calculate_text_score(self, fields: Tuple[str, ...], keywords: List[str]) -> float:
         """
         Calculate keyword matching score from text
         
         Args:
-            text: Text to analyze
+            fields: Text fields to analyze
             keywords: List of keywords
             
         Returns:
             Matching score
         """
-        if not text or not keywords:
+        if not keywords:
             return 0.0
         
-        matches = 0
-        for keyword in keywords:
-            if keyword in text:
-                matches += 1
+        matches = sum(1 for keyword in keywords if any(keyword in field for field in fields))
         
         return matches / len(keywords)
     
@@ -940,10 +1201,10 @@ class PubMedScraper:
             return ""
         
         # Remove HTML tags
-        text = re.sub(r'<[^>]+>', '', text)
+        text = HTML_TAG_PATTERN.sub('', text)
         
         # Remove consecutive spaces
-        text = re.sub(r'\s+', ' ', text)
+        text = WHITESPACE_PATTERN.sub(' ', text)
         
         return text.strip()
     
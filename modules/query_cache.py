@@ -0,0 +1,126 @@
+"""
+PubMed query cache module
+Store E-utilities responses on disk so repeated queries skip the network
+"""
+
+import os
+import json
+import time
+import hashlib
+import logging
+from pathlib import Path
+from typing import Dict, Optional, Any
+
+# Import config file
+try:
+    import config
+except ImportError:
+    print("Warning: config.py not found. Using default settings.")
+    config = None
+
+class QueryCache:
+    """Disk-backed cache of E-utilities response bodies"""
+
+    # Parameters that identify the client rather than the query itself
+    IGNORED_PARAMS = ('api_key', 'tool', 'email')
+
+    def __init__(self):
+        """Initialize query cache"""
+        self.logger = logging.getLogger(__name__)
+        self.enabled = getattr(config, 'ENABLE_CACHING', False)
+        self.cache_dir = Path(getattr(config, 'CACHE_DIR', './cache'))
+        self.duration = getattr(config, 'CACHE_DURATION', 3600)
+
+        if self.enabled:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            self.prune()
+            self.logger.info(f"Query cache enabled: {self.cache_dir} (TTL {self.duration}s)")
+
+    def make_key(self, url: str, params: Dict[str, Any]) -> str:
+        """
+        Build cache key from request URL and normalized query parameters
+
+        Args:
+            url: Request URL
+            params: Request parameters
+
+        Returns:
+            Hex digest identifying the query
+        """
+        normalized = {}
+        for name, value in params.items():
+            if name in self.IGNORED_PARAMS:
+                continue
+            value = str(value).strip()
+            if name == 'term':
+                # PubMed search terms are case-insensitive
+                value = " ".join(value.lower().split())
+            normalized[name] = value
+
+        payload = json.dumps([url, sorted(normalized.items())])
+        return hashlib.blake2b(payload.encode('utf-8'), digest_size=16).hexdigest()
+
+    def get(self, url: str, params: Dict[str, Any]) -> Optional[bytes]:
+        """
+        Return cached response body if present and not expired
+
+        Args:
+            url: Request URL
+            params: Request parameters
+
+        Returns:
+            Cached response body, or None on miss
+        """
+        if not self.enabled:
+            return None
+
+        cache_file = self.cache_dir / f"{self.make_key(url, params)}.xml"
+        try:
+            if time.time() - cache_file.stat().st_mtime > self.duration:
+                cache_file.unlink()  # Expired entries are rewritten on the next miss anyway
+                return None
+            content = cache_file.read_bytes()
+        except OSError:
+            return None
+
+        self.logger.debug(f"Query cache hit: {cache_file.name}")
+        return content
+
+    def prune(self):
+        """Delete expired cache entries and temp files left by interrupted writes"""
+        expiry = time.time() - self.duration
+        removed = 0
+        with os.scandir(self.cache_dir) as entries:
+            for entry in entries:
+                if not entry.name.endswith(('.xml', '.tmp')):
+                    continue
+                try:
+                    if entry.stat().st_mtime < expiry:
+                        os.remove(entry.path)
+                        removed += 1
+                except OSError:
+                    continue
+        
+        if removed:
+            self.logger.info(f"Query cache pruned: {removed} expired entries")
+
+    def set(self, url: str, params: Dict[str, Any], content: bytes):
+        """
+        Store response body in the cache
+
+        Args:
+            url: Request URL
+            params: Request parameters
+            content: Response body
+        """
+        if not self.enabled:
+            return
+
+        cache_file = self.cache_dir / f"{self.make_key(url, params)}.xml"
+        temp_file = cache_file.with_suffix(f".{os.getpid()}.tmp")
+        try:
+            # Write then rename so readers never see a partial entry
+            temp_file.write_bytes(content)
+            os.replace(temp_file, cache_file)
+        except OSError as e:
+            self.logger.warning(f"Query cache write failed: {str(e)}")
@@ -4,9 +4,9 @@ Regularly collect and save papers using PubMed API
 """
 
 import schedule
-import time
 import threading
 import logging
+import functools
 from datetime import datetime
 from typing import List, Optional
 
@@ -15,16 +15,25 @@ from modules.pubmed_scraper import PubMedScraper
 from modules.markdown_saver import MarkdownSaver
 import config
 
+# Weekdays accepted in SCHEDULE_DAYS (each is a Job property in the schedule library)
+SCHEDULE_DAY_NAMES = frozenset(("monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday"))
+
 class PaperScrapperScheduler:
     """Paper scraper scheduler"""
     
-    def __init__(self):
-        """Initialize scheduler"""
+    def __init__(self, scraper=None, markdown_saver=None):
+        """Initialize scheduler
+        
+        Args:
+            scraper: PubMedScraper to reuse (a new one is created if omitted)
+            markdown_saver: MarkdownSaver to reuse (a new one is created if omitted)
+        """
         self.logger = logging.getLogger(__name__)
-        self.scraper = PubMedScraper()
-        self.markdown_saver = MarkdownSaver()
+        self.scraper = scraper if scraper is not None else PubMedScraper()
+        self.markdown_saver = markdown_saver if markdown_saver is not None else MarkdownSaver()
         self.is_running = False
         self.scheduler_thread = None
+        self.stop_event = threading.Event()
         
         # Load configuration
         self.schedule_enabled = getattr(config, 'SCHEDULE_ENABLED', True)
@@ -35,6 +44,16 @@ class PaperScrapperScheduler:
         
         self.logger.info("Paper scraper scheduler initialized")
     
+    @functools.cached_property
+    def schedule_days_str(self) -> str:
+        """Comma-separated schedule days (settings are fixed after init)"""
+        return ', '.join(self.schedule_days)
+    
+    @functools.cached_property
+    def search_keywords_str(self) -> str:
+        """Comma-separated search keywords (settings are fixed after init)"""
+        return ', '.join(self.search_keywords)
+    
     def setup_schedule(self):
         """Setup schedule"""
         if not self.schedule_enabled:
@@ -48,24 +67,13 @@ class PaperScrapperScheduler:
         for day in self.schedule_days:
             day_lower = day.lower()
             
-            if day_lower == "monday":
-                schedule.every().monday.at(self.schedule_time).do(self.run_scraping_job)
-            elif day_lower == "tuesday":
-                schedule.every().tuesday.at(self.schedule_time).do(self.run_scraping_job)
-            elif day_lower == "wednesday":
-                schedule.every().wednesday.at(self.schedule_time).do(self.run_scraping_job)
-            elif day_lower == "thursday":
-                schedule.every().thursday.at(self.schedule_time).do(self.run_scraping_job)
-            elif day_lower == "friday":
-                schedule.every().friday.at(self.schedule_time).do(self.run_scraping_job)
-            elif day_lower == "saturday":
-                schedule.every().saturday.at(self.schedule_time).do(self.run_scraping_job)
-            elif day_lower == "sunday":
-                schedule.every().sunday.at(self.schedule_time).do(self.run_scraping_job)
+            if day_lower in SCHEDULE_DAY_NAMES:
+                # Job.monday, Job.tuesday, ... select the weekday
+                getattr(schedule.every(), day_lower).at(self.schedule_time).do(self.run_scraping_job)
             else:
                 self.logger.warning(f"Unknown day: {day}")
         
-        self.logger.info(f"Schedule setup complete: {', '.join(self.schedule_days)} {self.schedule_time}")
+        self.logger.info(f"Schedule setup complete: {self.schedule_days_str} {self.schedule_time}")
     
     def run_scraping_job(self):
         """Execute scraping job"""
@@ -83,40 +91,10 @@ class PaperScrapperScheduler:
             
             # Save as markdown files
             self.logger.info(f"Saving {len(papers)} papers to markdown...")
-            saved_count = 0
             
-            for paper in papers:
-                try:
-                    # Convert paper info to dictionary
-                    paper_data = {
-                        'title': paper.title,
-                        'authors': ', '.join(paper.authors),
-                        'journal': paper.journal,
-                        'pub_date': paper.pub_date,
-                        'doi': paper.doi,
-                        'pmid': paper.pmid,
-                        'pmc_id': paper.pmc_id,
-                        'keywords': ', '.join(paper.keywords),
-                        'abstract': paper.abstract,
-                        'collection_date': paper.collection_date,
-                        'search_keyword': paper.search_keyword,
-                        'keyword_score': f"{paper.keyword_score:.2f}",
-                        'relevance_category': paper.relevance_category,
-                        'korean_summary': paper.korean_summary,
-                        'language': paper.language,
-                        'publication_type': paper.publication_type,
-                        'mesh_terms': ', '.join(paper.mesh_terms),
-                        'grants': ', '.join(paper.grants)
-                    }
-                    
-                    # Save markdown file
-                    success = self.markdown_saver.save_paper(paper_data)
-                    if success:
-                        saved_count += 1
-                        
-                except Exception as e:
-                    self.logger.error(f"Error saving paper (PMID: {paper.pmid}): {str(e)}")
-                    continue
+            # Convert paper info to dictionaries, then write them concurrently (the saver logs per-paper failures)
+            papers_data = [self.scraper.paper_to_dict(paper) for paper in papers]
+            saved_count = self.markdown_saver.save_papers(papers_data)
             
             # Log execution results
             end_time = datetime.now()
@@ -129,6 +107,10 @@ class PaperScrapperScheduler:
             
         except Exception as e:
             self.logger.error(f"Error during scraping job: {str(e)}")
+        finally:
+            # Write out buffered log records now; the process may idle for days until the next job
+            for handler in logging.getLogger().handlers:
+                handler.flush()
     
     def start_scheduler(self):
         """Start scheduler"""
@@ -142,6 +124,7 @@ class PaperScrapperScheduler:
         
         self.setup_schedule()
         self.is_running = True
+        self.stop_event.clear()
         
         # Run scheduler in separate thread
         self.scheduler_thread = threading.Thread(target=self._scheduler_loop, daemon=True)
@@ -156,6 +139,7 @@ class PaperScrapperScheduler:
             return
         
         self.is_running = False
+        self.stop_event.set()  # Wake the scheduler loop immediately
         schedule.clear()
         
         # Wait for thread to finish
@@ -166,13 +150,18 @@ class PaperScrapperScheduler:
     
     def _scheduler_loop(self):
         """Scheduler loop"""
-        while self.is_running:
+        while not self.stop_event.is_set():
+            idle_seconds = None
             try:
                 schedule.run_pending()
-                time.sleep(60)  # Check schedule every minute
+                idle_seconds = schedule.idle_seconds()
             except Exception as e:
                 self.logger.error(f"Scheduler loop error: {str(e)}")
-                time.sleep(60)
+            
+            # Sleep until the next job is due, checking at least every minute (stop_scheduler interrupts the wait)
+            if idle_seconds is None:
+                idle_seconds = 60
+            self.stop_event.wait(min(max(idle_seconds, 0), 60))
     
     def run_once(self):
         """Run once"""
@@ -199,7 +188,9 @@ class PaperScrapperScheduler:
             'enabled': self.schedule_enabled,
             'time': self.schedule_time,
             'days': self.schedule_days,
+            'days_str': self.schedule_days_str,
             'keywords': self.search_keywords,
+            'keywords_str': self.search_keywords_str,
             'max_results': self.max_results,
             'is_running': self.is_running,
             'next_run': self.get_next_run_time(),
@@ -5,30 +5,41 @@ Monitor CPU, Memory, Network usage when running Paper Surfer
 """
 
 import psutil
-import time
 import threading
 import subprocess
 import sys
+from array import array
 from datetime import datetime
 
 class ResourceMonitor:
     def __init__(self):
         self.monitoring = False
+        self.stop_event = threading.Event()
         self.process = None
+        self.target_pid = None
         self.stats = {
-            'cpu_samples': [],
-            'memory_samples': [],
-            'network_samples': [],
+            'cpu_samples': array('f'),
+            'memory_samples': array('f'),
+            'network_sent': None,  # Bytes sent/received since monitoring started (latest sample)
+            'network_recv': None,
             'start_time': None,
             'end_time': None
         }
         
     def get_paper_surfer_process(self):
         """Find Paper Surfer process"""
-        for proc in psutil.process_iter(['pid', 'name', 'cmdline']):
+        # Use the process started by run_with_monitoring when there is one
+        if self.target_pid:
+            try:
+                return psutil.Process(self.target_pid)
+            except psutil.NoSuchProcess:
+                return None
+        
+        # Otherwise scan by name, reading the command line only for Python processes
+        for proc in psutil.process_iter(['pid', 'name']):
             try:
                 if proc.info['name'] == 'python.exe' or proc.info['name'] == 'python':
-                    cmdline = proc.info['cmdline']
+                    cmdline = proc.cmdline()
                     if cmdline and 'main.py' in ' '.join(cmdline):
                         return proc
             except:
@@ -42,10 +53,15 @@ class ResourceMonitor:
         
         initial_network = psutil.net_io_counters()
         
-        while self.monitoring:
+        # Prime CPU sampling: non-blocking calls report usage since the previous call
+        psutil.cpu_percent(interval=None)
+        sample_delay = 1  # First sample after one second, then every 5 seconds
+        
+        while self.monitoring and not self.stop_event.wait(sample_delay):
+            sample_delay = 5
             try:
                 # System resources
-                cpu_percent = psutil.cpu_percent(interval=1)
+                cpu_percent = psutil.cpu_percent(interval=None)
                 memory = psutil.virtual_memory()
                 network = psutil.net_io_counters()
                 
@@ -56,10 +72,8 @@ class ResourceMonitor:
                 # Store samples
                 self.stats['cpu_samples'].append(cpu_percent)
                 self.stats['memory_samples'].append(memory.percent)
-                self.stats['network_samples'].append({
-                    'sent': network_sent,
-                    'recv': network_recv
-                })
+                self.stats['network_sent'] = network_sent
+                self.stats['network_recv'] = network_recv
                 
                 # Display current stats
                 print(f"[{datetime.now().strftime('%H:%M:%S')}] "
@@ -67,8 +81,6 @@ class ResourceMonitor:
                       f"Memory: {memory.percent:5.1f}% | "
                       f"Network: ↑{network_sent/(1024*1024):6.1f}MB ↓{network_recv/(1024*1024):6.1f}MB")
                 
-                time.sleep(5)  # Monitor every 5 seconds
-                
             except KeyboardInterrupt:
                 break
             except Exception as e:
@@ -78,6 +90,7 @@ class ResourceMonitor:
     def run_with_monitoring(self):
         """Run Paper Surfer with resource monitoring"""
         self.monitoring = True
+        self.stop_event.clear()
         self.stats['start_time'] = datetime.now()
         
         # Start monitoring in separate thread
@@ -94,6 +107,7 @@ class ResourceMonitor:
                 stderr=subprocess.STDOUT,
                 text=True
             )
+            self.target_pid = self.process.pid
             
             # Wait for completion
             stdout, stderr = self.process.communicate()
@@ -106,6 +120,7 @@ class ResourceMonitor:
             print(f"❌ Error running Paper Surfer: {e}")
         finally:
             self.monitoring = False
+            self.stop_event.set()
             self.stats['end_time'] = datetime.now()
             
     def analyze_results(self):
@@ -124,30 +139,31 @@ class ResourceMonitor:
         
         # CPU Usage
         cpu_samples = self.stats['cpu_samples']
+        avg_cpu = sum(cpu_samples)/len(cpu_samples)
         print(f"\n🖥️  CPU Usage:")
-        print(f"   Average: {sum(cpu_samples)/len(cpu_samples):5.1f}%")
+        print(f"   Average: {avg_cpu:5.1f}%")
         print(f"   Maximum: {max(cpu_samples):5.1f}%")
         print(f"   Minimum: {min(cpu_samples):5.1f}%")
         
         # Memory Usage
         memory_samples = self.stats['memory_samples']
+        avg_memory = sum(memory_samples)/len(memory_samples)
         print(f"\n💾 Memory Usage:")
-        print(f"   Average: {sum(memory_samples)/len(memory_samples):5.1f}%")
+        print(f"   Average: {avg_memory:5.1f}%")
         print(f"   Maximum: {max(memory_samples):5.1f}%")
         print(f"   Minimum: {min(memory_samples):5.1f}%")
         
         # Network Usage
-        if self.stats['network_samples']:
-            last_network = self.stats['network_samples'][-1]
+        if self.stats['network_sent'] is not None:
+            network_sent = self.stats['network_sent']
+            network_recv = self.stats['network_recv']
             print(f"\n🌐 Network Usage:")
-            print(f"   Total Sent: {last_network['sent']/(1024*1024):6.1f} MB")
-            print(f"   Total Received: {last_network['recv']/(1024*1024):6.1f} MB")
-            print(f"   Total Transfer: {(last_network['sent'] + last_network['recv'])/(1024*1024):6.1f} MB")
+            print(f"   Total Sent: {network_sent/(1024*1024):6.1f} MB")
+            print(f"   Total Received: {network_recv/(1024*1024):6.1f} MB")
+            print(f"   Total Transfer: {(network_sent + network_recv)/(1024*1024):6.1f} MB")
             
         # Resource Impact Assessment
         print(f"\n📈 Resource Impact Assessment:")
-        avg_cpu = sum(cpu_samples)/len(cpu_samples)
-        avg_memory = sum(memory_samples)/len(memory_samples)
         
         if avg_cpu < 5:
             cpu_impact = "🟢 Very Low"
@@ -191,6 +207,7 @@ def main():
     except KeyboardInterrupt:
         print("\n⏹️  Monitoring stopped by user")
         monitor.monitoring = False
+        monitor.stop_event.set()
         if monitor.process:
             monitor.process.terminate()
 